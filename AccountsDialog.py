@@ -0,0 +1,233 @@
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
+                              QAbstractItemView, QFileDialog)
+from PySide6.QtCore import Signal
+
+
+class AccountsDialog(QDialog):
+    """Table of saved accounts with concurrent status refresh and batch go-live."""
+
+    COLUMNS = ("Name", "Username", "Status", "Can Go Live", "Error", "Stream URL", "Stream Key")
+
+    _row_updated = Signal(str, object)
+    _batch_result = Signal(object)
+    account_selected = Signal(str)  # token
+    accounts_changed = Signal()
+
+    def __init__(self, sessions, tasks, job_defaults=None, journal=None, parent=None):
+        super().__init__(parent)
+        self.sessions = sessions
+        self.tasks = tasks
+        # Callable returning the title/game/mature settings used for batch go-live
+        self.job_defaults = job_defaults or (lambda: {})
+        # SessionJournal used to show streams still live from a previous run
+        self.journal = journal
+        self.batch_results = []
+        self.setWindowTitle("Accounts")
+        self.setMinimumSize(700, 400)
+        self.init_ui()
+        self._row_updated.connect(self.update_row)
+        self._batch_result.connect(self.show_batch_result)
+        self.tasks.busy_changed.connect(self.handle_busy_changed)
+        self.populate()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        # Add account row
+        add_row = QHBoxLayout()
+        self.name_entry = QLineEdit()
+        self.name_entry.setPlaceholderText("Account name")
+        self.name_entry.setFixedHeight(28)
+        add_row.addWidget(self.name_entry)
+        self.token_entry = QLineEdit()
+        self.token_entry.setPlaceholderText("Token")
+        self.token_entry.setEchoMode(QLineEdit.Password)
+        self.token_entry.setFixedHeight(28)
+        add_row.addWidget(self.token_entry)
+        add_btn = QPushButton("Add")
+        add_btn.setFixedHeight(28)
+        add_btn.clicked.connect(self.add_account)
+        add_row.addWidget(add_btn)
+        layout.addLayout(add_row)
+
+        # Accounts table
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        layout.addWidget(self.table)
+
+        # Buttons
+        buttons = QHBoxLayout()
+        self.refresh_btn = QPushButton("Refresh All")
+        self.refresh_btn.clicked.connect(self.refresh_all)
+        buttons.addWidget(self.refresh_btn)
+        use_btn = QPushButton("Use Selected")
+        use_btn.setToolTip("Load the selected account's token in the main window")
+        use_btn.clicked.connect(self.use_selected)
+        buttons.addWidget(use_btn)
+        remove_btn = QPushButton("Remove Selected")
+        remove_btn.clicked.connect(self.remove_selected)
+        buttons.addWidget(remove_btn)
+        layout.addLayout(buttons)
+
+        # Batch buttons
+        batch_buttons = QHBoxLayout()
+        self.batch_start_btn = QPushButton("Go Live Selected")
+        self.batch_start_btn.setToolTip("Start streams for the selected accounts with the main window's title and category")
+        self.batch_start_btn.clicked.connect(lambda: self.run_batch("start"))
+        batch_buttons.addWidget(self.batch_start_btn)
+        self.batch_end_btn = QPushButton("End Live Selected")
+        self.batch_end_btn.clicked.connect(lambda: self.run_batch("end"))
+        batch_buttons.addWidget(self.batch_end_btn)
+        export_btn = QPushButton("Export Results…")
+        export_btn.setToolTip("Save the last batch's stream URLs and keys as JSON or CSV")
+        export_btn.clicked.connect(self.export_results)
+        batch_buttons.addWidget(export_btn)
+        layout.addLayout(batch_buttons)
+
+    # ------------------------------------------------------------------ #
+    #  Table                                                               #
+    # ------------------------------------------------------------------ #
+
+    def populate(self):
+        self.table.setRowCount(0)
+        for name in self.sessions.names():
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self.table.setItem(row, 0, QTableWidgetItem(name))
+            self.update_row(name, self.sessions.status.get(name))
+            running = (self.journal.latest(name, self.sessions.token(name))
+                       if self.journal is not None else None)
+            if running:
+                self.table.setItem(row, 5, QTableWidgetItem(running["rtmp"]))
+                self.table.setItem(row, 6, QTableWidgetItem(running["key"]))
+
+    def _row_for(self, name):
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).text() == name:
+                return row
+        return None
+
+    def update_row(self, name, result):
+        row = self._row_for(name)
+        if row is None:
+            return
+        info = (result or {}).get("info")
+        values = (
+            (info.username or "") if info else "",
+            (info.application_status or "") if info else "",
+            str(info.can_be_live) if info and info.authenticated else "",
+            (result or {}).get("error") or "",
+        )
+        for column, value in enumerate(values, start=1):
+            self.table.setItem(row, column, QTableWidgetItem(value))
+
+    def selected_names(self):
+        rows = sorted({index.row() for index in self.table.selectedIndexes()})
+        return [self.table.item(row, 0).text() for row in rows]
+
+    # ------------------------------------------------------------------ #
+    #  Actions                                                             #
+    # ------------------------------------------------------------------ #
+
+    def add_account(self):
+        name = self.name_entry.text().strip()
+        token = self.token_entry.text().strip()
+        if not name or not token:
+            QMessageBox.warning(self, "Accounts", "Both a name and a token are required.")
+            return
+        self.sessions.add(name, token)
+        self.name_entry.clear()
+        self.token_entry.clear()
+        self.populate()
+        self.accounts_changed.emit()
+        submit, refresh = self._refresher("refresh")
+        submit(f"account:{name}", refresh, name,
+               on_success=lambda result: self.update_row(name, result))
+
+    def remove_selected(self):
+        for name in self.selected_names():
+            self.sessions.remove(name)
+        self.populate()
+        self.accounts_changed.emit()
+
+    def use_selected(self):
+        names = self.selected_names()
+        if names:
+            self.account_selected.emit(self.sessions.token(names[0]))
+
+    def _refresher(self, method):
+        """(submit, fn) for a SessionManager refresh: coroutines on the loop thread when aiohttp is installed."""
+        if self.sessions.use_async:
+            return self.tasks.submit_async, getattr(self.sessions, f"{method}_async")
+        return self.tasks.submit, getattr(self.sessions, method)
+
+    def refresh_all(self):
+        submit, refresh_all = self._refresher("refresh_all")
+        submit(
+            "accounts", refresh_all,
+            on_result=self._row_updated.emit,
+            on_error=lambda e: QMessageBox.critical(self, "Accounts", f"Refresh failed: {str(e)}"),
+        )
+
+    def run_batch(self, action):
+        names = self.selected_names()
+        if not names:
+            QMessageBox.warning(self, "Accounts", "Select at least one account.")
+            return
+        defaults = self.job_defaults() if action == "start" else {}
+        jobs = [dict(defaults, account=name) for name in names]
+        self.batch_results = []
+
+        from BatchLive import run_batch
+        self.tasks.submit(
+            "batch", run_batch, self.sessions, jobs, action,
+            on_result=self._batch_result.emit,
+            on_success=self.batch_finished,
+            on_error=lambda e: QMessageBox.critical(self, "Accounts", f"Batch failed: {str(e)}"),
+        )
+
+    def show_batch_result(self, result):
+        self.batch_results.append(result)
+        row = self._row_for(result["account"])
+        if row is None:
+            return
+        self.table.setItem(row, 4, QTableWidgetItem(result["error"] or ""))
+        if result["action"] == "start":
+            self.table.setItem(row, 5, QTableWidgetItem(result["rtmp"] or ""))
+            self.table.setItem(row, 6, QTableWidgetItem(result["key"] or ""))
+        elif result["ok"]:
+            self.table.setItem(row, 5, QTableWidgetItem(""))
+            self.table.setItem(row, 6, QTableWidgetItem(""))
+
+    def batch_finished(self, results):
+        self.batch_results = results
+        failed = [r["account"] for r in results if not r["ok"]]
+        if failed:
+            QMessageBox.warning(self, "Accounts", f"Failed for: {', '.join(failed)}")
+
+    def export_results(self):
+        if not self.batch_results:
+            QMessageBox.information(self, "Accounts", "No batch results to export yet.")
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Results", "streams.json", "JSON (*.json);;CSV (*.csv)"
+        )
+        if not path:
+            return
+        from BatchLive import to_csv, to_json
+        text = to_csv(self.batch_results) if path.lower().endswith(".csv") else to_json(self.batch_results)
+        with open(path, "w", newline="") as file:
+            file.write(text)
+
+    def handle_busy_changed(self, key, busy):
+        if key == "accounts":
+            self.refresh_btn.setEnabled(not busy)
+            self.refresh_btn.setText("Refreshing…" if busy else "Refresh All")
+        elif key == "batch":
+            self.batch_start_btn.setEnabled(not busy)
+            self.batch_end_btn.setEnabled(not busy)
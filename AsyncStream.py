@@ -0,0 +1,307 @@
+import asyncio
+import concurrent.futures
+import json
+import random
+import threading
+import time
+import aiohttp
+from HttpClient import HttpClient, request_key, shared_client
+from Instrumentation import recorder, redact
+from Models import OTHER, AccountInfo, Category, StreamStart
+from RequestScheduler import INTERACTIVE, RequestShed
+from Stream import Stream
+
+
+class ApiError(aiohttp.ClientError):
+    """The API answered with a status the caller can't use (throttled, error page)."""
+
+    def __init__(self, status: int, body=None):
+        super().__init__(f"HTTP {status}: {redact(body)}")
+        self.status = status
+
+
+_sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+# Identical GETs currently on the wire, per loop (see HttpClient's single-flight)
+_flights: dict[tuple, asyncio.Task] = {}
+
+
+def shared_session() -> aiohttp.ClientSession:
+    """The pooled aiohttp session of the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=256, limit_per_host=128, ttl_dns_cache=300)
+        session = _sessions[loop] = aiohttp.ClientSession(connector=connector)
+    return session
+
+
+async def close_session():
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def request(method: str, url: str, *, timeout=HttpClient.DEFAULT_TIMEOUT,
+                  retries: int | None = None, priority: int = INTERACTIVE, coalesce: bool = True,
+                  **kwargs):
+    """
+    One API call on the shared session: (status, decoded JSON or None).
+
+    Mirrors HttpClient.request: GETs are retried with full-jitter backoff on
+    connection errors and transient statuses, POSTs never are, and every call
+    is timed into the Instrumentation recorder. Identical GETs that overlap
+    share one call, and every attempt goes through the shared HttpClient's
+    RequestScheduler, so sync and async callers draw on the same rate limits.
+    Pass coalesce=False for calls that must not be shared.
+    """
+    key = None
+    if coalesce and kwargs.keys() <= {"params", "headers"}:
+        key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"), priority)
+    if key is None:
+        return await _send(method, url, timeout, retries, priority, **kwargs)
+
+    key = (asyncio.get_running_loop(), *key)
+    flight = _flights.get(key)
+    if flight is None:
+        flight = _flights[key] = asyncio.ensure_future(_send(method, url, timeout, retries, priority, **kwargs))
+        flight.add_done_callback(lambda _: _flights.pop(key, None))
+    else:
+        recorder().record_coalesced(method, url)
+    # shield: one waiter being cancelled must not cancel the call for the others
+    return await asyncio.shield(flight)
+
+
+async def _send(method: str, url: str, timeout, retries: int | None, priority: int, **kwargs):
+    method = method.upper()
+    scheduler = shared_client().scheduler
+    headers = kwargs.get("headers")
+    if retries is None:
+        retries = 2 if method in HttpClient.IDEMPOTENT_METHODS else 0
+    connect, read = timeout
+    client_timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    started = time.perf_counter()
+    backoff = 0.0
+    for attempt in range(retries + 1):
+        try:
+            await scheduler.acquire_async(url, headers, priority)
+        except RequestShed as e:
+            recorder().record(method, url, total_ms=(time.perf_counter() - started) * 1000,
+                              attempts=attempt + 1, backoff_ms=backoff * 1000, error=e)
+            raise
+        try:
+            async with shared_session().request(method, url, timeout=client_timeout, **kwargs) as response:
+                ttfb = time.perf_counter() - started
+                body = await response.read()
+                status = response.status
+                response_headers = response.headers
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if attempt == retries:
+                recorder().record(method, url, total_ms=(time.perf_counter() - started) * 1000,
+                                  attempts=attempt + 1, backoff_ms=backoff * 1000, error=e)
+                raise
+        else:
+            blocked = scheduler.observe(url, headers, status, response_headers)
+            if status not in HttpClient.RETRY_STATUSES or attempt == retries or blocked > 8.0:
+                recorder().record(method, url, total_ms=(time.perf_counter() - started) * 1000,
+                                  ttfb_ms=ttfb * 1000, status=status, attempts=attempt + 1,
+                                  backoff_ms=backoff * 1000, bytes_in=len(body))
+                try:
+                    return status, json.loads(body) if body else None
+                except ValueError:
+                    return status, None
+            if blocked:
+                continue
+        delay = random.uniform(0, min(8.0, 0.5 * 2 ** attempt))
+        backoff += delay
+        await asyncio.sleep(delay)
+
+
+class AsyncStream:
+    """
+    asyncio counterpart of Stream: same search/start/end/getInfo surface.
+
+    All calls share one pooled aiohttp session per event loop, so hundreds
+    of requests can be in flight on a single thread. The category cache,
+    index and session journal are Stream's, so both clients see the same
+    data.
+    """
+
+    def __init__(self, token, account=None):
+        self.account = account
+        self.token = token
+        self.id = None
+        if Stream.journal is not None:
+            running = Stream.journal.latest(account, token)
+            if running:
+                self.id = running["id"]
+        self.headers = {
+            "user-agent": Stream.USER_AGENT,
+            "authorization": f"Bearer {token}",
+        }
+
+    async def search(self, game):
+        if not game:
+            return []
+        game = game[:25]  # If the game name exceeds 25 characters, the API will return error 500
+        categories = Stream.category_cache.get(game)
+        if categories is None:
+            status, info = await request(
+                "GET", f"{Stream.API_BASE}/slobs/tiktok/info", params={"category": game},
+                headers=self.headers, timeout=Stream.TIMEOUTS["search"],
+                priority=Stream.PRIORITIES["search"],
+            )
+            if status != 200 or not isinstance(info, dict):
+                raise ApiError(status, info)
+            categories = Stream.category_cache.put(game, map(Category.from_json, info["categories"]))
+            if Stream.category_index is not None:
+                Stream.category_index.add(categories)
+        return (*categories, OTHER)
+
+    async def resolve_category(self, game):
+        """game_mask_id for an exact category name, or None if the API doesn't know it."""
+        if Stream.category_index is not None:
+            mask_id = Stream.category_index.lookup(game)
+            if mask_id:
+                return mask_id
+        for category in await self.search(game):
+            if category.full_name == game:
+                return category.game_mask_id
+        return None
+
+    async def start(self, title, category, audience_type='0') -> StreamStart | None:
+        form = aiohttp.FormData(default_to_multipart=True)
+        form.add_field("title", title)
+        form.add_field("device_platform", "win32")
+        form.add_field("category", category)
+        form.add_field("audience_type", audience_type)
+        response = _checked(*await request(
+            "POST", f"{Stream.API_BASE}/slobs/tiktok/stream/start", data=form,
+            headers=self.headers, timeout=Stream.TIMEOUTS["start"],
+            priority=Stream.PRIORITIES["start"],
+        ))
+        started = StreamStart.from_json(response)
+        if started is None:
+            print(f"Stream start failed: {redact(response)}")
+            return None
+        self.id = started.id
+        if Stream.journal is not None:
+            # fsync'd write; keep it off the event loop. As in Stream.start, a failure
+            # to record it must not fail a stream that is already live.
+            try:
+                await asyncio.to_thread(Stream.journal.record_start, started.id, started.rtmp,
+                                        started.key, self.account, self.token)
+            except OSError as e:
+                print(f"Could not record stream {started.id} in {Stream.journal.path}: {e}")
+        return started
+
+    async def end(self, stream_id=None):
+        stream_id = stream_id or self.id
+        if not stream_id:
+            return False
+        status, body = await request(
+            "POST", f"{Stream.API_BASE}/slobs/tiktok/stream/{stream_id}/end",
+            headers=self.headers, timeout=Stream.TIMEOUTS["end"],
+            priority=Stream.PRIORITIES["end"],
+        )
+        response = _checked(status, body)
+        success = bool(response.get("success")) if isinstance(response, dict) else False
+        # As in Stream.end: a 200 without success means the stream is already over
+        if success or status < 400:
+            if Stream.journal is not None:
+                try:
+                    await asyncio.to_thread(Stream.journal.record_end, stream_id,
+                                            None if success else self.token)
+                except OSError as e:
+                    print(f"Could not update {Stream.journal.path}: {e}")
+            if stream_id == self.id:
+                self.id = None
+        return success
+
+    async def getInfo(self, priority=None) -> AccountInfo:
+        status, body = await request(
+            "GET", f"{Stream.API_BASE}/slobs/tiktok/info",
+            headers=self.headers, timeout=Stream.TIMEOUTS["info"],
+            priority=Stream.PRIORITIES["info"] if priority is None else priority,
+        )
+        return AccountInfo.from_json(_checked(status, body), status)
+
+
+def _checked(status: int, body):
+    """Like Stream._json: error payloads pass through, 429s and non-JSON errors raise ApiError."""
+    if status == 429 or (body is None and status >= 400):
+        raise ApiError(status, body)
+    return body
+
+
+async def exchange_code_for_token(code: str, code_verifier: str) -> str | None:
+    """Async version of TokenRetriever._exchange_code_for_token."""
+    from TokenRetriever import TokenRetriever
+
+    try:
+        status, data = await request(
+            "GET", f"{TokenRetriever.API_BASE}/slobs/auth/data",
+            params={"code_verifier": code_verifier, "code": code},
+            headers=TokenRetriever.EXCHANGE_HEADERS, timeout=(5, 30),
+            # An auth code is single use: a retry can only fail, and a shared call would hide the first result
+            retries=0, coalesce=False,
+        )
+    except (aiohttp.ClientError, asyncio.TimeoutError, RequestShed) as e:
+        print(f"Network error during token exchange: {e}")
+        return None
+    if status != 200 or not isinstance(data, dict) or not data.get("success"):
+        print(f"Token exchange failed: HTTP {status} — {redact(data)}")
+        return None
+    return data["data"].get("oauth_token")
+
+
+# ---------------------------------------------------------------------- #
+#  Loop thread                                                             #
+# ---------------------------------------------------------------------- #
+
+class LoopThread:
+    """
+    An asyncio event loop running forever on one daemon thread.
+
+    Synchronous code (the Qt GUI, thread-based helpers) hands coroutines to
+    it with `submit()` and gets a concurrent.futures.Future back.
+    """
+
+    def __init__(self, name: str = "asyncio"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True, name=name)
+        self._thread.start()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: float | None = None):
+        """Block the calling thread until `coro` finishes on the loop."""
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        if self.loop.is_running():
+            self.submit(close_session()).result(5)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(5)
+
+
+_loop_thread: LoopThread | None = None
+_loop_thread_lock = threading.Lock()
+
+
+def loop_thread() -> LoopThread:
+    """Return the lazily started process-wide LoopThread."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = LoopThread()
+        return _loop_thread
+
+
+def stop_loop_thread():
+    """Close the pooled session and stop the loop thread, if it was ever started."""
+    global _loop_thread
+    with _loop_thread_lock:
+        thread, _loop_thread = _loop_thread, None
+    if thread is not None:
+        thread.stop()
@@ -0,0 +1,139 @@
+import csv
+import io
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+from urllib3.exceptions import NewConnectionError
+from RequestScheduler import RequestShed
+
+RESULT_FIELDS = ("account", "action", "ok", "id", "rtmp", "key", "error", "attempts")
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        if wait:
+            time.sleep(wait)
+
+
+def _never_sent(error: Exception) -> bool:
+    """True only if the request provably never reached the server."""
+    if isinstance(error, (requests.ConnectTimeout, RequestShed)):
+        return True
+    if isinstance(error, requests.ConnectionError) and error.args:
+        # DNS failure / connection refused: urllib3 never got a socket up.
+        # "Connection aborted" / RemoteDisconnected may come after the body was sent.
+        reason = getattr(error.args[0], "reason", error.args[0])
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _is_retryable(action: str, error: Exception) -> bool:
+    # A start that failed mid-request may still have created a stream on the
+    # server, so only retry it when the request provably never left. Ending
+    # an already-ended stream is harmless, so end retries on any network error.
+    if action == "start":
+        return _never_sent(error)
+    return isinstance(error, requests.RequestException)
+
+
+def _run_job(sessions, action: str, job: dict, limiter: RateLimiter, retries: int) -> dict:
+    name = job["account"]
+    result = {"account": name, "action": action, "ok": False, "id": None,
+              "rtmp": None, "key": None, "error": None, "attempts": 0}
+    try:
+        stream = sessions.stream(name)
+    except KeyError:
+        result["error"] = f"Unknown account: {name}"
+        return result
+
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        result["attempts"] = attempt + 1
+        try:
+            if action == "start":
+                category = job.get("category")
+                if category is None:
+                    game = job.get("game", "")
+                    category = stream.resolve_category(game) if game else ""
+                    if category is None:
+                        result["error"] = f"Unknown category: {game}"
+                        return result
+                audience_type = "1" if job.get("mature") or job.get("audience_type") == "1" else "0"
+                started = stream.start(job.get("title", ""), category, audience_type)
+                if started is not None:
+                    result.update(ok=True, id=started.id, rtmp=started.rtmp, key=started.key, error=None)
+                else:
+                    result["error"] = "Streamlabs refused to start the stream"
+            else:
+                stream_id = job.get("id") or stream.id
+                if not stream_id:
+                    result["error"] = "No stream id to end"
+                    return result
+                result["id"] = stream_id
+                result["ok"] = bool(stream.end(stream_id))
+                result["error"] = None if result["ok"] else "Streamlabs refused to end the stream"
+            return result
+        except Exception as e:
+            result["error"] = str(e)
+            if attempt == retries or not _is_retryable(action, e):
+                return result
+        time.sleep(random.uniform(0, min(8.0, 0.5 * 2 ** attempt)))
+    return result
+
+
+def run_batch(sessions, jobs, action: str = "start", max_concurrency: int = 4,
+              rate: float = 2.0, retries: int = 2, on_result=None) -> list[dict]:
+    """
+    Start (or end) streams for many accounts concurrently.
+
+    Each job is a dict with "account" plus, for start, "title" and either
+    "category" (game_mask_id) or "game" (name), and optionally "mature";
+    for end, an optional "id" (defaults to the account's last started
+    stream). Calls are spaced by a shared rate limit and failed accounts
+    never hold up the others. Results come back in job order.
+    """
+    if action not in ("start", "end"):
+        raise ValueError(f"Unknown batch action: {action}")
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    limiter = RateLimiter(rate)
+    results: list[dict | None] = [None] * len(jobs)
+    workers = max(1, min(max_concurrency, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as executor:
+        futures = {
+            executor.submit(_run_job, sessions, action, job, limiter, retries): i
+            for i, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if on_result:
+                on_result(results[i])
+    return results
+
+
+def to_json(results) -> str:
+    return json.dumps(list(results), indent=2)
+
+
+def to_csv(results) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(results)
+    return buffer.getvalue()
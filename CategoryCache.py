@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class CategoryCache:
+    """
+    In-process LRU + TTL cache for category search results.
+
+    Keys are the (already truncated) query, case-folded. A result list shorter
+    than `page_size` is treated as complete — the API had nothing more to give —
+    so a longer query that starts with a cached complete query can be answered
+    by filtering that list locally ("mine" -> "minec") without a round trip.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0, page_size: int = 10):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.page_size = page_size
+        self._entries: OrderedDict[str, tuple[float, tuple, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.narrowed = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return query.casefold()
+
+    def get(self, query: str) -> tuple | None:
+        """Return cached categories for `query`, or None on a miss."""
+        key = self._key(query)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+
+            # Walk back through shorter prefixes looking for a complete result
+            for end in range(len(key) - 1, 0, -1):
+                parent = self._lookup(key[:end], now)
+                if parent is None or not parent[2]:
+                    continue
+                categories = tuple(
+                    c for c in parent[1] if key in c.full_name.casefold()
+                )
+                self._store(key, categories, True, now)
+                self.narrowed += 1
+                return categories
+
+            self.misses += 1
+            return None
+
+    def put(self, query: str, categories) -> tuple:
+        categories = tuple(categories)
+        with self._lock:
+            self._store(self._key(query), categories,
+                        len(categories) < self.page_size, time.monotonic())
+        return categories
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "narrowed": self.narrowed,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                # every hit or narrowed lookup is a network call we didn't make
+                "saved_calls": self.hits + self.narrowed,
+            }
+
+    # ------------------------------------------------------------------ #
+    #  Internals — caller must hold self._lock                             #
+    # ------------------------------------------------------------------ #
+
+    def _lookup(self, key: str, now: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if now - entry[0] > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, categories: tuple, complete: bool, now: float):
+        self._entries[key] = (now, categories, complete)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,192 @@
+import bisect
+import json
+import threading
+from collections import Counter
+from difflib import SequenceMatcher
+from FileUtils import atomic_write
+from Models import Category
+
+
+class CategoryIndex:
+    """
+    Persistent local index of every category the API has ever returned.
+
+    Fed from each search response and stored as compact JSON next to
+    config.json, it lets the app resolve a saved game's mask id at startup
+    without a network call and render suggestions before the API answers.
+
+    Lookups are case-insensitive. Prefix search is a bisect over a sorted key
+    list; fuzzy search narrows candidates through a trigram index (built on
+    first use) before scoring, so it stays fast with tens of thousands of names.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str = "category_index.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._by_key: dict[str, Category] = {}  # folded name -> Category
+        self._sorted_keys: list[str] = []
+        self._trigrams: dict[str, set[str]] | None = None
+        self._dirty = False
+        self._load()
+
+    def __len__(self):
+        return len(self._by_key)
+
+    # ------------------------------------------------------------------ #
+    #  Persistence                                                         #
+    # ------------------------------------------------------------------ #
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable category index {self.path}: {e}")
+            return
+        if data.get("v") != self.FORMAT_VERSION:
+            return
+        for name, mask_id in data.get("c", []):
+            self._by_key[name.casefold()] = Category(name, mask_id)
+        self._sorted_keys = sorted(self._by_key)
+
+    def save(self):
+        """Write the index to disk if anything changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"v": self.FORMAT_VERSION,
+                       "c": [[c.full_name, c.game_mask_id] for c in self._by_key.values()]}
+            self._dirty = False
+        data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        try:
+            atomic_write(self.path, data.encode("utf-8"))
+        except OSError:
+            with self._lock:
+                self._dirty = True
+            raise
+
+    # ------------------------------------------------------------------ #
+    #  Updates                                                             #
+    # ------------------------------------------------------------------ #
+
+    def add(self, categories):
+        """Merge Category results into the index."""
+        with self._lock:
+            for category in categories:
+                if not category.full_name or not category.game_mask_id:
+                    continue
+                key = category.full_name.casefold()
+                existing = self._by_key.get(key)
+                if existing == category:
+                    continue
+                self._by_key[key] = category
+                self._dirty = True
+                if existing is None:
+                    bisect.insort(self._sorted_keys, key)
+                    if self._trigrams is not None:
+                        self._index_trigrams(key)
+
+    # ------------------------------------------------------------------ #
+    #  Queries                                                             #
+    # ------------------------------------------------------------------ #
+
+    def warm(self):
+        """Build the trigram index ahead of the first fuzzy query (e.g. on a worker thread)."""
+        with self._lock:
+            self._ensure_trigrams()
+
+    def lookup(self, name: str) -> str | None:
+        """Exact (case-insensitive) name -> game_mask_id."""
+        entry = self._by_key.get(name.casefold()) if name else None
+        return entry.game_mask_id if entry else None
+
+    def prefix(self, query: str, limit: int = 10, blocking: bool = True) -> list[Category]:
+        key = query.casefold()
+        if not self._lock.acquire(blocking):
+            return []
+        try:
+            start = bisect.bisect_left(self._sorted_keys, key)
+            keys = []
+            for k in self._sorted_keys[start:start + limit]:
+                if not k.startswith(key):
+                    break
+                keys.append(k)
+            return [self._by_key[k] for k in keys]
+        finally:
+            self._lock.release()
+
+    def fuzzy(self, query: str, limit: int = 10, cutoff: float = 0.6,
+              blocking: bool = True) -> list[Category]:
+        """
+        Typo-tolerant match: trigram candidate pass, then SequenceMatcher ranking.
+        With blocking=False nothing is matched while the index is busy or its
+        trigrams haven't been built yet (see warm()).
+        """
+        key = query.casefold()
+        if not self._lock.acquire(blocking):
+            return []
+        try:
+            if self._trigrams is None and not blocking:
+                return []
+            self._ensure_trigrams()
+            shared = Counter()
+            for gram in self._grams(key):
+                shared.update(self._trigrams.get(gram, ()))
+            candidates = [k for k, _ in shared.most_common(limit * 10)]
+        finally:
+            self._lock.release()
+
+        matcher = SequenceMatcher(b=key, autojunk=False)
+        scored = []
+        for k in candidates:
+            # Compare against the same-length head so "minecraf" scores well
+            # against "minecraft: story mode", not just "minecraft"
+            matcher.set_seq1(k[:len(key)])
+            head_score = matcher.ratio()
+            matcher.set_seq1(k)
+            score = max(head_score, matcher.ratio())
+            if score >= cutoff:
+                scored.append((score, k))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self._by_key[k] for _, k in scored[:limit]]
+
+    def suggest(self, query: str, limit: int = 10, blocking: bool = True) -> list[Category]:
+        """
+        Prefix matches first, topped up with fuzzy matches. Pass blocking=False
+        on the GUI thread: it then never waits on a load or warm-up in progress.
+        """
+        if not query:
+            return []
+        results = self.prefix(query, limit, blocking)
+        if len(results) < limit:
+            seen = {r.full_name for r in results}
+            for r in self.fuzzy(query, limit, blocking=blocking):
+                if r.full_name not in seen:
+                    results.append(r)
+                    if len(results) == limit:
+                        break
+        return results
+
+    # ------------------------------------------------------------------ #
+    #  Internals                                                           #
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _grams(key: str):
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _ensure_trigrams(self):
+        """Caller must hold self._lock."""
+        if self._trigrams is None:
+            self._trigrams = {}
+            for key in self._by_key:
+                self._index_trigrams(key)
+
+    def _index_trigrams(self, key: str):
+        for gram in self._grams(key):
+            self._trigrams.setdefault(gram, set()).add(key)
@@ -0,0 +1,113 @@
+import json
+import threading
+from FileUtils import atomic_write
+
+
+def _migrate_1_to_2(data: dict) -> dict:
+    # v1 files were written without a version; audience_type was sometimes a
+    # bool/int and accounts could contain half-filled entries
+    audience_type = data.get("audience_type", "0")
+    data["audience_type"] = "1" if str(audience_type).lower() in ("1", "true") else "0"
+    data["accounts"] = [
+        {"name": a["name"], "token": a["token"]}
+        for a in data.get("accounts") or []
+        if isinstance(a, dict) and a.get("name") and a.get("token")
+    ]
+    return data
+
+
+class ConfigStore:
+    """
+    config.json with versioned schema, coalesced saves and atomic writes.
+
+    `update()` only changes the in-memory copy and (re)arms a `delay`-second
+    timer; the file is rewritten once the burst of updates settles, on the
+    timer thread, via temp-file-and-rename so a crash can never leave a
+    truncated config (and lose the token) behind. Keys nobody touched are
+    written back exactly as they were loaded, so callers only need to
+    materialise rarely used sections such as "accounts" when they use them.
+    A failed write is kept pending and passed to `on_error`.
+    """
+
+    SCHEMA_VERSION = 2
+    # version -> function upgrading a config dict from that version to the next
+    MIGRATIONS = {1: _migrate_1_to_2}
+
+    def __init__(self, path: str = "config.json", delay: float = 0.5, on_error=None):
+        self.path = path
+        self.delay = delay
+        self.on_error = on_error  # called with the OSError, on the writing thread
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._dirty = False
+        self._data = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {"version": self.SCHEMA_VERSION}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable {self.path}: {e}")
+            return {"version": self.SCHEMA_VERSION}
+        if not isinstance(data, dict):
+            print(f"Ignoring unexpected {self.path} contents")
+            return {"version": self.SCHEMA_VERSION}
+
+        version = data.get("version", 1)
+        while version < self.SCHEMA_VERSION:
+            data = self.MIGRATIONS[version](data)
+            version += 1
+        data["version"] = version
+        return data
+
+    # ------------------------------------------------------------------ #
+    #  Access                                                              #
+    # ------------------------------------------------------------------ #
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            return self._data.get(key, default)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return json.loads(json.dumps(self._data))
+
+    def update(self, values: dict | None = None, **kwargs):
+        """Merge `values` into the config and schedule a save."""
+        with self._lock:
+            self._data.update(values or {}, **kwargs)
+            self._dirty = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # ------------------------------------------------------------------ #
+    #  Persistence                                                         #
+    # ------------------------------------------------------------------ #
+
+    def flush(self) -> bool:
+        """Write pending changes now (called by the timer, and on exit); False if the write failed."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return True
+                payload = json.dumps(self._data, indent=2).encode("utf-8")
+                self._dirty = False
+            try:
+                atomic_write(self.path, payload, fsync=True)
+            except OSError as e:
+                print(f"Failed to save {self.path}: {e}")
+                with self._lock:
+                    self._dirty = True
+                if self.on_error is not None:
+                    self.on_error(e)
+                return False
+        return True
@@ -0,0 +1,83 @@
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+                              QFileDialog)
+from PySide6.QtCore import QTimer
+from Instrumentation import recorder
+
+
+class DiagnosticsDialog(QDialog):
+    """Per-endpoint request latency and error counts from the Instrumentation recorder."""
+
+    COLUMNS = ("Endpoint", "Calls", "Errors", "Retries", "Shared", "p50 ms", "p95 ms", "Max ms", "TTFB p50 ms", "Statuses")
+
+    def __init__(self, parent=None, startup=None):
+        super().__init__(parent)
+        self.startup = startup  # StartupOrchestrator of this launch, for its phase timings
+        self.setWindowTitle("Diagnostics")
+        self.setMinimumSize(800, 300)
+        self.init_ui()
+        # Live view while open; the recorder itself costs nothing to read
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.populate)
+        self.timer.start(2000)
+        self.populate()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        self.footer = QLabel()
+        layout.addWidget(self.footer)
+        self.startup_label = QLabel()
+        layout.addWidget(self.startup_label)
+
+        buttons = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.populate)
+        buttons.addWidget(refresh_btn)
+        export_btn = QPushButton("Export JSON Lines…")
+        export_btn.setToolTip("Save the recent request log (tokens and keys are redacted)")
+        export_btn.clicked.connect(self.export_events)
+        buttons.addWidget(export_btn)
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self.clear)
+        buttons.addWidget(clear_btn)
+        layout.addLayout(buttons)
+
+    @staticmethod
+    def _ms(value):
+        return "" if value is None else f"{value:.0f}"
+
+    def populate(self):
+        rows = recorder().summary()
+        self.table.setRowCount(len(rows))
+        for row, r in enumerate(rows):
+            values = (
+                r["endpoint"], str(r["count"]), str(r["errors"]), str(r["retries"]),
+                str(r["coalesced"]),
+                self._ms(r["p50_ms"]), self._ms(r["p95_ms"]), self._ms(r["max_ms"]),
+                self._ms(r["ttfb_p50_ms"]),
+                ", ".join(f"{k}×{v}" for k, v in sorted(r["statuses"].items())),
+            )
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        events = recorder().events()
+        fresh = sum(1 for e in events if e["new_connection"])
+        self.footer.setText(f"{len(events)} recent requests, {fresh} opened a new connection (DNS/TCP/TLS)")
+        self.startup_label.setText(self.startup.report() if self.startup else "")
+
+    def export_events(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Requests", "requests.jsonl", "JSON Lines (*.jsonl)")
+        if path:
+            recorder().export_jsonl(path)
+
+    def clear(self):
+        recorder().clear()
+        self.populate()
@@ -0,0 +1,37 @@
+import os
+import tempfile
+
+
+def atomic_write(path: str, data: bytes, fsync: bool = False):
+    """
+    Replace `path` with `data` without ever leaving a truncated file behind.
+
+    The bytes go to a temp file in the same directory which is then renamed
+    over the target. With `fsync=True` the data (and the rename, where the
+    platform allows it) is flushed to disk before returning.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # Persist the rename itself (POSIX only; Windows has no directory fds)
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,201 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from Instrumentation import recorder
+from RequestScheduler import INTERACTIVE, RequestScheduler, RequestShed
+
+# Only these kwargs may differ between requests that share one network call
+_COALESCE_KWARGS = frozenset({"params", "headers"})
+
+
+def request_key(method: str, url: str, params=None, headers=None, priority: int = INTERACTIVE):
+    """
+    Identity of a request for coalescing: method, full URL with query, the
+    headers (which carry the bearer token) and the scheduler priority, or
+    None if it must not be shared. Priority is part of it so an urgent
+    caller never inherits a background call's short wait and shedding.
+    """
+    if method.upper() not in HttpClient.IDEMPOTENT_METHODS:
+        return None
+    if params:
+        url = requests.Request(method, url, params=params).prepare().url
+    header_items = tuple(sorted((k.lower(), str(v)) for k, v in (headers or {}).items()))
+    return method.upper(), url, header_items, priority
+
+
+class _Flight:
+    """One in-progress request that later identical callers wait on."""
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class HttpClient:
+    """
+    Process-wide HTTP transport shared by Stream, TokenRetriever and VersionChecker.
+
+    One keep-alive connection pool per host means TLS handshakes happen once
+    and later calls reuse the warm connection. Every call gets a timeout, and
+    idempotent requests (GET/HEAD) are retried with jittered exponential
+    backoff on connection errors and transient 5xx/429 responses. POSTs are
+    never retried here: starting a stream twice is worse than failing once.
+    Every call is timed into the process-wide Instrumentation recorder.
+
+    Every attempt is admitted by the client's RequestScheduler first (per
+    host / per token rate limits, by priority), and every response is fed
+    back to it so 429s and Retry-After pause that host or token for
+    everyone, not just the caller that hit them.
+
+    Identical GETs (same URL, query, headers and priority, so the same
+    token) that overlap in time are single-flighted: the first caller does the network
+    call and everyone who arrives while it is in flight gets that same
+    response (or exception). Nothing is kept once the call completes, so
+    this never serves stale data.
+    """
+
+    DEFAULT_TIMEOUT = (5, 15)  # (connect, read) seconds
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 16,
+                 retries: int = 2, backoff: float = 0.5, backoff_max: float = 8.0,
+                 coalesce: bool = True, scheduler: RequestScheduler | None = None):
+        self.retries = retries
+        self.scheduler = scheduler or RequestScheduler()
+        self.coalesce = coalesce
+        self._flights: dict[tuple, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,  # retries are handled in request() so they can be jittered
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, *, timeout=None, retries: int | None = None,
+                priority: int = INTERACTIVE, coalesce: bool = True, **kwargs) -> requests.Response:
+        """`coalesce=False` opts a GET out of single-flight (e.g. one-time OAuth codes)."""
+        key = None
+        if self.coalesce and coalesce and kwargs.keys() <= _COALESCE_KWARGS:
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"), priority)
+        if key is None:
+            return self._send(method, url, timeout, retries, priority, **kwargs)
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            recorder().record_coalesced(method, url)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = self._send(method, url, timeout, retries, priority, **kwargs)
+            return flight.response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _send(self, method: str, url: str, timeout, retries: int | None, priority: int,
+              **kwargs) -> requests.Response:
+        method = method.upper()
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+        if retries is None:
+            retries = self.retries if method in self.IDEMPOTENT_METHODS else 0
+
+        started = time.perf_counter()
+        connections = self._connection_count(url)
+        backoff = 0.0
+        headers = kwargs.get("headers")
+        for attempt in range(retries + 1):
+            try:
+                self.scheduler.acquire(url, headers, priority)
+            except RequestShed as e:
+                self._record(method, url, started, connections, attempt, backoff, error=e)
+                raise
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == retries:
+                    self._record(method, url, started, connections, attempt, backoff, error=e)
+                    raise
+            else:
+                blocked = self.scheduler.observe(url, headers, response.status_code, response.headers)
+                if (response.status_code not in self.RETRY_STATUSES or attempt == retries
+                        or blocked > self.backoff_max):
+                    self._record(method, url, started, connections, attempt, backoff, response=response)
+                    return response
+                response.close()
+                if blocked:
+                    # The next acquire() waits out the server's Retry-After
+                    continue
+            delay = self._backoff_delay(attempt)
+            backoff += delay
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def _connection_count(self, url: str) -> int | None:
+        """Connections opened so far by the pool serving `url` (to spot fresh TCP/TLS setups)."""
+        try:
+            host = urlsplit(url).hostname
+            pools = self.session.get_adapter(url).poolmanager.pools
+            return sum(pools[key].num_connections for key in pools.keys() if key.key_host == host)
+        except Exception:
+            return None
+
+    def _record(self, method, url, started, connections, attempt, backoff, response=None, error=None):
+        after = self._connection_count(url)
+        recorder().record(
+            method, url,
+            total_ms=(time.perf_counter() - started) * 1000,
+            ttfb_ms=response.elapsed.total_seconds() * 1000 if response is not None else None,
+            status=response.status_code if response is not None else None,
+            attempts=attempt + 1,
+            backoff_ms=backoff * 1000,
+            bytes_in=len(response.content) if response is not None else 0,
+            new_connection=None if connections is None or after is None else after > connections,
+            error=error,
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(cap, base * 2**attempt)]."""
+        return random.uniform(0, min(self.backoff_max, self.backoff * (2 ** attempt)))
+
+
+_shared_client: HttpClient | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> HttpClient:
+    """Return the lazily created process-wide HttpClient."""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_lock:
+            if _shared_client is None:
+                _shared_client = HttpClient()
+    return _shared_client
@@ -0,0 +1,193 @@
+import bisect
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+from urllib.parse import urlsplit
+
+# Values that must never reach logs, exports or the diagnostics panel
+_SECRET_PATTERNS = (
+    re.compile(r"(?i)(bearer\s+)[^\s\"']+"),
+    re.compile(r"(?i)(\b[\"']?(?:token|oauth_token|api_?token|key|stream_?key|code|code_verifier|authorization)[\"']?\s*[:=]\s*[\"']?)[^\"'&\s,}]+"),
+    re.compile(r"(rtmps?://[^\s\"']*/)[^\s\"'/]+"),
+    re.compile(r"\b[0-9a-fA-F]{32,}\b"),
+)
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F-]{16,})$")
+
+
+def redact(text) -> str:
+    """Mask tokens, stream keys, auth codes and long hex secrets in `text`."""
+    text = str(text)
+    for pattern in _SECRET_PATTERNS:
+        if pattern.groups:
+            text = pattern.sub(lambda m: m.group(1) + "***", text)
+        else:
+            text = pattern.sub("***", text)
+    return text
+
+
+def endpoint_label(method: str, url: str) -> str:
+    """'POST streamlabs.com/api/v5/slobs/tiktok/stream/{id}/end' — ids folded, query dropped."""
+    parts = urlsplit(url)
+    path = "/".join("{id}" if _ID_SEGMENT.match(s) else s for s in parts.path.split("/"))
+    return f"{method.upper()} {parts.hostname or ''}{path}"
+
+
+class Histogram:
+    """Fixed log-spaced latency buckets (ms); cheap to update, good enough for p50/p95."""
+
+    BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, ms: float):
+        self.buckets[bisect.bisect_left(self.BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = ms if self.max is None else max(self.max, ms)
+
+    def percentile(self, p: float) -> float | None:
+        """Upper bound of the bucket holding the p-th percentile (capped at the observed max)."""
+        if not self.count:
+            return None
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                bound = self.BOUNDS[i] if i < len(self.BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+
+class _EndpointStats:
+    __slots__ = ("latency", "ttfb", "statuses", "errors", "retries", "bytes_in", "coalesced")
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.ttfb = Histogram()
+        self.statuses = Counter()
+        self.errors = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.coalesced = 0
+
+
+class Instrumentation:
+    """
+    In-memory record of every outgoing HTTP call made through HttpClient.
+
+    Per endpoint it keeps latency and time-to-first-byte histograms, status
+    counts, retries and bytes received, plus how many callers were served
+    by another caller's in-flight request instead of their own. The last
+    `maxlen` individual events are kept for export as JSON lines.
+    Everything stored is already redacted.
+    """
+
+    def __init__(self, maxlen: int = 2000):
+        self._lock = threading.Lock()
+        self._events = deque(maxlen=maxlen)
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self.enabled = True
+
+    def record(self, method: str, url: str, *, total_ms: float, ttfb_ms: float | None = None,
+               status: int | None = None, attempts: int = 1, backoff_ms: float = 0.0,
+               bytes_in: int = 0, new_connection: bool | None = None, error: Exception | None = None):
+        if not self.enabled:
+            return
+        label = endpoint_label(method, url)
+        event = {
+            "ts": time.time(),
+            "endpoint": label,
+            "status": status,
+            "attempts": attempts,
+            "total_ms": round(total_ms, 2),
+            "ttfb_ms": None if ttfb_ms is None else round(ttfb_ms, 2),
+            "backoff_ms": round(backoff_ms, 2),
+            "bytes_in": bytes_in,
+            "new_connection": new_connection,
+            "error": redact(f"{type(error).__name__}: {error}") if error is not None else None,
+        }
+        with self._lock:
+            self._events.append(event)
+            stats = self._endpoints.get(label)
+            if stats is None:
+                stats = self._endpoints[label] = _EndpointStats()
+            stats.latency.add(total_ms)
+            if ttfb_ms is not None:
+                stats.ttfb.add(ttfb_ms)
+            stats.statuses[status if status is not None else "error"] += 1
+            stats.retries += attempts - 1
+            stats.bytes_in += bytes_in
+            if error is not None or (status is not None and status >= 400):
+                stats.errors += 1
+
+    def record_coalesced(self, method: str, url: str):
+        """A caller joined an identical in-flight request instead of making its own."""
+        if not self.enabled:
+            return
+        label = endpoint_label(method, url)
+        with self._lock:
+            stats = self._endpoints.get(label)
+            if stats is None:
+                stats = self._endpoints[label] = _EndpointStats()
+            stats.coalesced += 1
+
+    def summary(self) -> list[dict]:
+        """One row per endpoint, slowest p95 first."""
+        with self._lock:
+            rows = [
+                {
+                    "endpoint": label,
+                    "count": s.latency.count,
+                    "errors": s.errors,
+                    "retries": s.retries,
+                    "coalesced": s.coalesced,
+                    "p50_ms": s.latency.percentile(50),
+                    "p95_ms": s.latency.percentile(95),
+                    "mean_ms": s.latency.total / s.latency.count if s.latency.count else None,
+                    "max_ms": s.latency.max,
+                    "ttfb_p50_ms": s.ttfb.percentile(50),
+                    "bytes_in": s.bytes_in,
+                    "statuses": {str(k): v for k, v in s.statuses.items()},
+                }
+                for label, s in self._endpoints.items()
+            ]
+        return sorted(rows, key=lambda r: r["p95_ms"] or 0, reverse=True)
+
+    def events(self) -> list[dict]:
+        with self._lock:
+            return list(self._events)
+
+    def to_jsonl(self) -> str:
+        return "".join(json.dumps(event) + "\n" for event in self.events())
+
+    def export_jsonl(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_jsonl())
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._endpoints.clear()
+
+
+_recorder: Instrumentation | None = None
+_recorder_lock = threading.Lock()
+
+
+def recorder() -> Instrumentation:
+    """Return the process-wide Instrumentation instance."""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = Instrumentation()
+    return _recorder
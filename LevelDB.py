@@ -0,0 +1,363 @@
+"""
+Minimal read-only LevelDB reader (write-ahead logs + SSTables) in pure Python.
+
+Only what is needed to pull values out of Chromium's Local Storage database:
+no MANIFEST/version handling, no checksum verification. When the same user key
+shows up in several files, the entry with the highest sequence number wins,
+which is exactly how LevelDB itself resolves it.
+"""
+import glob
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+
+LOG_BLOCK_SIZE = 32768
+LOG_HEADER_SIZE = 7  # crc32c (4) + length (2) + type (1)
+LOG_FULL, LOG_FIRST, LOG_MIDDLE, LOG_LAST = 1, 2, 3, 4
+
+TYPE_DELETION = 0
+TYPE_VALUE = 1
+
+TABLE_FOOTER_SIZE = 48
+TABLE_MAGIC = 0xdb4775248b80fb57
+BLOCK_TRAILER_SIZE = 5  # compression type (1) + crc32c (4)
+COMPRESSION_NONE = 0
+COMPRESSION_SNAPPY = 1
+
+
+class LevelDBError(Exception):
+    pass
+
+
+# ---------------------------------------------------------------------- #
+#  Encoding helpers                                                        #
+# ---------------------------------------------------------------------- #
+
+def _varint(buf, pos: int) -> tuple[int, int]:
+    """Decode a little-endian base-128 varint; returns (value, new_pos)."""
+    result = shift = 0
+    while True:
+        if pos >= len(buf):
+            raise LevelDBError("Truncated varint")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def snappy_decompress(data: bytes) -> bytes:
+    """Decode a raw (unframed) Snappy block."""
+    expected, pos = _varint(data, 0)
+    out = bytearray()
+    end = len(data)
+    while pos < end:
+        tag = data[pos]
+        pos += 1
+        kind = tag & 3
+        if kind == 0:  # literal
+            length = tag >> 2
+            if length >= 60:
+                extra = length - 59
+                length = int.from_bytes(data[pos:pos + extra], "little")
+                pos += extra
+            length += 1
+            out += data[pos:pos + length]
+            pos += length
+            continue
+
+        if kind == 1:
+            length = ((tag >> 2) & 0x7) + 4
+            offset = ((tag >> 5) << 8) | data[pos]
+            pos += 1
+        elif kind == 2:
+            length = (tag >> 2) + 1
+            offset = int.from_bytes(data[pos:pos + 2], "little")
+            pos += 2
+        else:
+            length = (tag >> 2) + 1
+            offset = int.from_bytes(data[pos:pos + 4], "little")
+            pos += 4
+        if offset == 0 or offset > len(out):
+            raise LevelDBError("Invalid snappy copy offset")
+        start = len(out) - offset
+        if offset >= length:
+            out += out[start:start + length]
+        else:
+            # Overlapping copy repeats the last `offset` bytes
+            chunk = out[start:]
+            out += (chunk * (length // offset + 1))[:length]
+
+    if len(out) != expected:
+        raise LevelDBError("Snappy length mismatch")
+    return bytes(out)
+
+
+def _split_internal_key(ikey: bytes) -> tuple[bytes, int, int]:
+    """Internal key -> (user_key, sequence, value_type)."""
+    if len(ikey) < 8:
+        raise LevelDBError("Internal key too short")
+    trailer = int.from_bytes(ikey[-8:], "little")
+    return ikey[:-8], trailer >> 8, trailer & 0xff
+
+
+# ---------------------------------------------------------------------- #
+#  Write-ahead log                                                         #
+# ---------------------------------------------------------------------- #
+
+def iter_log_records(data, offset: int = 0):
+    """
+    Yield (end_offset, payload) for each complete logical record in a log
+    buffer, starting at `offset` (which must be a record boundary).
+
+    A trailing partial record (the writer is mid-append) is not yielded, so
+    `end_offset` of the last yielded record is a safe resume point.
+    """
+    pending = bytearray()
+    in_fragment = False
+    pos = offset
+    size = len(data)
+    while pos < size:
+        block_left = LOG_BLOCK_SIZE - (pos % LOG_BLOCK_SIZE)
+        if block_left < LOG_HEADER_SIZE:
+            pos += block_left  # zero-filled block trailer
+            continue
+        if pos + LOG_HEADER_SIZE > size:
+            return
+        length = data[pos + 4] | (data[pos + 5] << 8)
+        rtype = data[pos + 6]
+        start = pos + LOG_HEADER_SIZE
+        if start + length > size:
+            return
+        fragment = data[start:start + length]
+        pos = start + length
+
+        if rtype == LOG_FULL:
+            pending.clear()
+            in_fragment = False
+            yield pos, bytes(fragment)
+        elif rtype == LOG_FIRST:
+            pending[:] = fragment
+            in_fragment = True
+        elif rtype == LOG_MIDDLE and in_fragment:
+            pending += fragment
+        elif rtype == LOG_LAST and in_fragment:
+            pending += fragment
+            in_fragment = False
+            yield pos, bytes(pending)
+            pending.clear()
+        elif rtype == 0:
+            # Preallocated zero space: nothing more in this block
+            pos = -(-pos // LOG_BLOCK_SIZE) * LOG_BLOCK_SIZE
+        else:
+            pending.clear()
+            in_fragment = False
+
+
+def iter_write_batch(batch: bytes):
+    """Yield (user_key, sequence, value_type, value) for each op in a WriteBatch."""
+    if len(batch) < 12:
+        return
+    seq, count = struct.unpack_from("<QI", batch, 0)
+    pos = 12
+    for i in range(count):
+        if pos >= len(batch):
+            return
+        tag = batch[pos]
+        pos += 1
+        key_len, pos = _varint(batch, pos)
+        key = batch[pos:pos + key_len]
+        pos += key_len
+        if tag == TYPE_VALUE:
+            value_len, pos = _varint(batch, pos)
+            value = batch[pos:pos + value_len]
+            pos += value_len
+        elif tag == TYPE_DELETION:
+            value = None
+        else:
+            return
+        yield key, seq + i, tag, value
+
+
+def iter_log_entries(data, offset: int = 0):
+    """Yield (end_offset, user_key, sequence, value_type, value) from a log buffer."""
+    for end, record in iter_log_records(data, offset):
+        for key, seq, vtype, value in iter_write_batch(record):
+            yield end, key, seq, vtype, value
+
+
+# ---------------------------------------------------------------------- #
+#  SSTables                                                                #
+# ---------------------------------------------------------------------- #
+
+def _iter_block(block: bytes):
+    """Yield (key, value) pairs from a table block (data or index)."""
+    if len(block) < 4:
+        raise LevelDBError("Block too short")
+    num_restarts = struct.unpack_from("<I", block, len(block) - 4)[0]
+    limit = len(block) - 4 - 4 * num_restarts
+    pos = 0
+    key = b""
+    while pos < limit:
+        shared, pos = _varint(block, pos)
+        non_shared, pos = _varint(block, pos)
+        value_len, pos = _varint(block, pos)
+        key = key[:shared] + block[pos:pos + non_shared]
+        pos += non_shared
+        yield key, block[pos:pos + value_len]
+        pos += value_len
+
+
+class Table:
+    """Reader for a single .ldb/.sst file; only touches the blocks it needs."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._index = None
+
+    def _read_block(self, f, offset: int, size: int) -> bytes:
+        f.seek(offset)
+        raw = f.read(size + BLOCK_TRAILER_SIZE)
+        if len(raw) != size + BLOCK_TRAILER_SIZE:
+            raise LevelDBError(f"Truncated block in {self.path}")
+        block, compression = raw[:size], raw[size]
+        if compression == COMPRESSION_SNAPPY:
+            return snappy_decompress(block)
+        if compression == COMPRESSION_NONE:
+            return block
+        raise LevelDBError(f"Unsupported block compression {compression}")
+
+    def _load_index(self, f):
+        if self._index is None:
+            f.seek(0, os.SEEK_END)
+            file_size = f.tell()
+            if file_size < TABLE_FOOTER_SIZE:
+                raise LevelDBError(f"{self.path} is too small to be a table")
+            f.seek(file_size - TABLE_FOOTER_SIZE)
+            footer = f.read(TABLE_FOOTER_SIZE)
+            if int.from_bytes(footer[-8:], "little") != TABLE_MAGIC:
+                raise LevelDBError(f"Bad table magic in {self.path}")
+            _, pos = _varint(footer, 0)  # metaindex offset
+            _, pos = _varint(footer, pos)  # metaindex size
+            index_offset, pos = _varint(footer, pos)
+            index_size, pos = _varint(footer, pos)
+            index = []
+            for separator, handle in _iter_block(self._read_block(f, index_offset, index_size)):
+                offset, hpos = _varint(handle, 0)
+                size, _ = _varint(handle, hpos)
+                index.append((_split_internal_key(separator)[0], offset, size))
+            self._index = index
+        return self._index
+
+    def get(self, user_key: bytes):
+        """Yield (sequence, value_type, value) for every version of `user_key`."""
+        with open(self.path, "rb") as f:
+            for separator, offset, size in self._load_index(f):
+                # Each separator is >= every key in its block
+                if separator < user_key:
+                    continue
+                past_key = False
+                for ikey, value in _iter_block(self._read_block(f, offset, size)):
+                    key, seq, vtype = _split_internal_key(ikey)
+                    if key == user_key:
+                        yield seq, vtype, value
+                    elif key > user_key:
+                        past_key = True
+                        break
+                if past_key or separator > user_key:
+                    return
+
+    def items(self):
+        """Yield (user_key, sequence, value_type, value) for every entry (full scan)."""
+        with open(self.path, "rb") as f:
+            for _, offset, size in self._load_index(f):
+                for ikey, value in _iter_block(self._read_block(f, offset, size)):
+                    key, seq, vtype = _split_internal_key(ikey)
+                    yield key, seq, vtype, value
+
+
+# ---------------------------------------------------------------------- #
+#  Database                                                                #
+# ---------------------------------------------------------------------- #
+
+class LevelDB:
+    """Read-only view over a LevelDB directory's log and table files."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._tables: dict[str, Table] = {}
+
+    def log_files(self) -> list[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "*.log")))
+
+    def table_files(self) -> list[str]:
+        return sorted(
+            glob.glob(os.path.join(self.directory, "*.ldb"))
+            + glob.glob(os.path.join(self.directory, "*.sst"))
+        )
+
+    def _table(self, path: str) -> Table:
+        table = self._tables.get(path)
+        if table is None:
+            table = self._tables[path] = Table(path)
+        return table
+
+    @contextmanager
+    def _map_log(self, path: str):
+        """The log file memory-mapped (records are sliced out, never the whole file)."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+    def get(self, user_key: bytes) -> bytes | None:
+        """Latest live value for `user_key`, or None if missing or deleted."""
+        return self.get_many((user_key,)).get(user_key)
+
+    def get_many(self, user_keys) -> dict[bytes, bytes]:
+        """
+        Latest live value of each of `user_keys` that exists; the logs are read
+        once. A log or table that can't be read is reported and skipped.
+        """
+        wanted = set(user_keys)
+        best = {}  # user_key -> (sequence, value_type, value)
+        for path in self.log_files():
+            try:
+                with self._map_log(path) as data:
+                    for _, key, seq, vtype, value in iter_log_entries(data):
+                        if key in wanted and (key not in best or seq > best[key][0]):
+                            best[key] = (seq, vtype, value)
+            except (OSError, ValueError, LevelDBError) as e:
+                print(f"Error reading {path}: {e}")
+        for path in self.table_files():
+            try:
+                table = self._table(path)
+                for user_key in wanted:
+                    for seq, vtype, value in table.get(user_key):
+                        if user_key not in best or seq > best[user_key][0]:
+                            best[user_key] = (seq, vtype, value)
+            except (OSError, LevelDBError) as e:
+                print(f"Error reading {path}: {e}")
+        return {key: value for key, (_, vtype, value) in best.items() if vtype == TYPE_VALUE}
+
+    def items(self):
+        """
+        Yield (user_key, sequence, value_type, value) across all files (full
+        scan). As in get_many, a file that can't be read is reported and skipped.
+        """
+        for path in self.log_files():
+            try:
+                with self._map_log(path) as data:
+                    for _, key, seq, vtype, value in iter_log_entries(data):
+                        yield key, seq, vtype, value
+            except (OSError, ValueError, LevelDBError) as e:
+                print(f"Error reading {path}: {e}")
+        for path in self.table_files():
+            try:
+                yield from self._table(path).items()
+            except (OSError, LevelDBError) as e:
+                print(f"Error reading {path}: {e}")
@@ -0,0 +1,171 @@
+import glob
+import json
+import mmap
+import os
+import platform
+from FileUtils import atomic_write
+from LevelDB import LevelDB, TYPE_VALUE
+
+# Chromium's localStorage stores strings either as Latin-1 or as UTF-16LE,
+# so the key can appear in the leveldb files in either encoding.
+_TOKEN_NEEDLES = tuple(
+    ('"apiToken":"'.encode(encoding), encoding)
+    for encoding in ("latin-1", "utf-16-le")
+)
+_HEX_DIGITS = frozenset(b"0123456789abcdefABCDEF")
+_MAX_TOKEN_CHARS = 256
+
+# Chromium localStorage keys are "_" + origin + "\x00" + script key, the
+# script key prefixed with \x01 (Latin-1) or \x00 (UTF-16LE). These are where
+# the desktop app keeps apiToken; they are tried before any full scan.
+_KNOWN_TOKEN_KEYS = tuple(
+    b"_" + origin + b"\x00" + key
+    for origin in (b"https://streamlabs.com", b"file://")
+    for key in (b"\x01apiToken", b"\x00" + "apiToken".encode("utf-16-le"))
+)
+
+# leveldb directory -> localStorage key last seen holding the apiToken,
+# persisted so a new process doesn't have to scan the whole database again
+_token_keys: dict[str, bytes] = {}
+TOKEN_KEYS_PATH = "local_token_keys.json"
+
+
+def _load_token_keys():
+    try:
+        with open(TOKEN_KEYS_PATH, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        _token_keys.update({d: bytes.fromhex(k) for d, k in stored.items()})
+    except (OSError, ValueError, AttributeError):
+        pass
+
+
+def _save_token_key(directory: str, key: bytes):
+    if _token_keys.get(directory) == key:
+        return
+    _token_keys[directory] = key
+    try:
+        atomic_write(TOKEN_KEYS_PATH, json.dumps({d: k.hex() for d, k in _token_keys.items()}).encode())
+    except OSError as e:
+        print(f"Could not save {TOKEN_KEYS_PATH}: {e}")
+
+
+def leveldb_dir() -> str | None:
+    """The slobs-client Local Storage leveldb directory, or None on unsupported platforms."""
+    if platform.system() == 'Windows':
+        return os.path.expandvars(r'%appdata%\slobs-client\Local Storage\leveldb')
+    if platform.system() == 'Darwin':
+        return os.path.expanduser(
+            '~/Library/Application Support/slobs-client/Local Storage/leveldb'
+        )
+    return None
+
+
+def _read_token_at(buf, start: int, encoding: str) -> str | None:
+    """Decode the hex token following a needle; None if it isn't a well-formed value."""
+    step = 2 if encoding == "utf-16-le" else 1
+    end = min(len(buf), start + _MAX_TOKEN_CHARS * step)
+    chars = bytearray()
+    for pos in range(start, end, step):
+        if step == 2 and (pos + 1 >= len(buf) or buf[pos + 1] != 0):
+            return None
+        byte = buf[pos]
+        if byte == 0x22:  # closing quote
+            return chars.decode("ascii") if chars else None
+        if byte not in _HEX_DIGITS:
+            return None
+        chars.append(byte)
+    return None
+
+
+def last_token(buf) -> str | None:
+    """
+    Return the last apiToken value in `buf` (bytes or mmap).
+
+    Searches backwards from the end, so the newest value is found first and
+    nothing is decoded or copied.
+    """
+    best_pos, best_token = -1, None
+    for needle, encoding in _TOKEN_NEEDLES:
+        end = len(buf)
+        while True:
+            pos = buf.rfind(needle, 0, end)
+            if pos <= best_pos:
+                break
+            token = _read_token_at(buf, pos + len(needle), encoding)
+            if token:
+                best_pos, best_token = pos, token
+                break
+            end = pos
+    return best_token
+
+
+def scan_file(path: str) -> str | None:
+    """Memory-map `path` and return its last apiToken value."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return last_token(mm)
+
+
+def _find_with_leveldb(directory: str) -> str | None:
+    """Look the token up through the LevelDB record/table reader."""
+    db = LevelDB(directory)
+    if not _token_keys:
+        _load_token_keys()
+
+    # Exact-key gets: only the table indexes and the blocks covering the key are read
+    remembered = _token_keys.get(directory)
+    candidates = ((remembered,) if remembered else ()) + _KNOWN_TOKEN_KEYS
+    values = db.get_many(candidates)
+    for key in candidates:
+        value = values.get(key)
+        token = last_token(value) if value else None
+        if token:
+            _save_token_key(directory, key)
+            return token
+
+    # Unknown origin (or the key moved): find the live localStorage entry
+    # that holds an apiToken, newest sequence number first
+    latest: dict[bytes, tuple[int, str | None]] = {}
+    for user_key, seq, vtype, value in db.items():
+        current = latest.get(user_key)
+        if current is None or seq > current[0]:
+            token = last_token(value) if vtype == TYPE_VALUE and value else None
+            latest[user_key] = (seq, token)
+
+    best = None
+    for user_key, (seq, token) in latest.items():
+        if token and (best is None or seq > best[0]):
+            best = (seq, user_key, token)
+    if best is None:
+        return None
+    _save_token_key(directory, best[1])
+    return best[2]
+
+
+def _scan_logs(directory: str) -> str | None:
+    """Fallback: raw byte scan of the leveldb logs, newest file first."""
+    files = sorted(glob.glob(os.path.join(directory, '*.log')), key=os.path.getmtime, reverse=True)
+    for file in files:
+        try:
+            token = scan_file(file)
+            if token:
+                return token
+        except Exception as e:
+            print(f"Error reading {file}: {e}")
+
+    return None
+
+
+def find_local_token(directory: str | None = None) -> str | None:
+    """Find the Streamlabs apiToken in the slobs-client Local Storage database."""
+    directory = directory or leveldb_dir()
+    if not directory or not os.path.isdir(directory):
+        return None
+
+    try:
+        return _find_with_leveldb(directory)
+    except Exception as e:
+        print(f"LevelDB read failed, falling back to raw log scan: {e}")
+        return _scan_logs(directory)
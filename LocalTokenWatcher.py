@@ -0,0 +1,110 @@
+import os
+import threading
+from LevelDB import LOG_BLOCK_SIZE, TYPE_VALUE, iter_log_entries
+from LocalTokenFinder import last_token, leveldb_dir
+
+
+class LocalTokenWatcher:
+    """
+    Follows the slobs-client leveldb logs and reports new apiToken values.
+
+    Each *.log file is parsed once to find its last record boundary; after
+    that only bytes appended past that offset are read. The directory is
+    polled every `poll_interval` seconds; a poll is a scandir plus one stat
+    per log, and files whose size hasn't changed are not opened.
+    `on_token(token)` is called from the watcher thread whenever the newest
+    token differs from the last one reported.
+    """
+
+    def __init__(self, on_token, directory: str | None = None,
+                 poll_interval: float = 0.25, current_token: str | None = None):
+        self.on_token = on_token
+        self.directory = directory or leveldb_dir()
+        self.poll_interval = poll_interval
+        self.token = current_token
+        self._offsets: dict[str, int] = {}
+        self._sizes: dict[str, int] = {}
+        self._last_seq = -1
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> bool:
+        if self._thread is not None:
+            return True
+        if not self.directory or not os.path.isdir(self.directory):
+            return False
+        self._thread = threading.Thread(target=self._run, daemon=True, name="token-watcher")
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+    # ------------------------------------------------------------------ #
+    #  Internals                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _run(self):
+        # Seed offsets without reporting: the current token is already known
+        self._poll(report=False)
+        while not self._stop.wait(self.poll_interval):
+            self._poll(report=True)
+
+    def _poll(self, report: bool):
+        try:
+            entries = [e for e in os.scandir(self.directory) if e.name.endswith(".log")]
+        except OSError:
+            return
+        seen = set()
+        found = None  # (sequence, token)
+        for entry in entries:
+            path = entry.path
+            seen.add(path)
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue
+            if self._sizes.get(path) == size:
+                continue
+            if size < self._offsets.get(path, 0):
+                self._offsets[path] = 0  # file was recycled
+            self._sizes[path] = size
+            try:
+                result = self._read_new(path)
+            except OSError as e:
+                print(f"Error reading {path}: {e}")
+                continue
+            if result and (found is None or result[0] > found[0]):
+                found = result
+
+        for path in set(self._offsets) - seen:
+            self._offsets.pop(path, None)
+            self._sizes.pop(path, None)
+
+        if found is None or found[0] <= self._last_seq:
+            return
+        self._last_seq = found[0]
+        if found[1] != self.token:
+            self.token = found[1]
+            if report:
+                self.on_token(found[1])
+
+    def _read_new(self, path: str):
+        """Parse records appended since the last visit; returns the newest (seq, token)."""
+        offset = self._offsets.get(path, 0)
+        # Read from the start of the enclosing block so block alignment holds
+        block_start = offset - offset % LOG_BLOCK_SIZE
+        with open(path, "rb") as f:
+            f.seek(block_start)
+            data = f.read()
+
+        newest = None
+        end = offset - block_start
+        for end, _, seq, vtype, value in iter_log_entries(data, end):
+            if vtype != TYPE_VALUE or not value:
+                continue
+            token = last_token(value)
+            if token and (newest is None or seq > newest[0]):
+                newest = (seq, token)
+        self._offsets[path] = block_start + end
+        return newest
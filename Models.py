@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+
+# Typed views of the Streamlabs payloads. Only the fields the app reads are
+# decoded; everything else in the response is dropped at parse time, which
+# keeps cached search results and the category index small.
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    full_name: str
+    game_mask_id: str
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Category":
+        return cls(data.get("full_name") or "", str(data.get("game_mask_id") or ""))
+
+    def to_dict(self) -> dict:
+        return {"full_name": self.full_name, "game_mask_id": self.game_mask_id}
+
+
+# Appended to every search result; shared, never rebuilt per call
+OTHER = Category("Other", "")
+
+
+@dataclass(frozen=True, slots=True)
+class AccountInfo:
+    username: str | None = None
+    application_status: str | None = None
+    can_be_live: bool = False
+    # False when the reply was an error payload (e.g. revoked token) rather than account info
+    authenticated: bool = False
+    message: str | None = None
+    # HTTP status of the reply, when known
+    status: int | None = None
+
+    @classmethod
+    def from_json(cls, data, status: int | None = None) -> "AccountInfo":
+        if not isinstance(data, dict):
+            return cls(message=str(data), status=status)
+        user = data.get("user") or {}
+        application = data.get("application_status") or {}
+        return cls(
+            username=user.get("username"),
+            application_status=application.get("status"),
+            can_be_live=bool(data.get("can_be_live", False)),
+            authenticated="user" in data or "can_be_live" in data,
+            message=data.get("message"),
+            status=status,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "username": self.username,
+            "application_status": self.application_status,
+            "can_be_live": self.can_be_live,
+            "authenticated": self.authenticated,
+            "message": self.message,
+            "status": self.status,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class StreamStart:
+    id: str
+    rtmp: str
+    key: str
+
+    @classmethod
+    def from_json(cls, data) -> "StreamStart | None":
+        """None when the reply doesn't describe a started stream."""
+        try:
+            return cls(str(data["id"]), data["rtmp"], data["key"])
+        except (KeyError, TypeError):
+            return None
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "rtmp": self.rtmp, "key": self.key}
+
+
+def to_json(value):
+    """`default=` hook for json.dumps so models serialise as plain dicts."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,262 @@
+import email.utils
+import hashlib
+import itertools
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+
+# Request priorities, most urgent first
+CRITICAL = 0     # go-live / end-live
+INTERACTIVE = 1  # search-as-you-type, user-triggered account info
+BACKGROUND = 2   # status polling, token validation, update checks
+
+
+class RequestShed(requests.ConnectionError):
+    """The request was never sent: it would have waited too long for its rate limit."""
+
+    def __init__(self, message, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Bucket:
+    """Token bucket; rate None means unlimited but still blockable by Retry-After."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated", "blocked_until")
+
+    def __init__(self, rate: float | None, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def ready_in(self, now: float) -> float:
+        self._refill(now)
+        wait = max(0.0, self.blocked_until - now)
+        if self.rate is not None and self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+        return wait
+
+    def take(self):
+        if self.rate is not None:
+            self.tokens -= 1
+
+    def block(self, until: float):
+        self.blocked_until = max(self.blocked_until, until)
+        self.tokens = min(self.tokens, 0)
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "buckets", "granted", "event", "notify")
+
+    def __init__(self, priority, seq, buckets, notify=None):
+        self.priority = priority
+        self.seq = seq
+        self.buckets = buckets
+        self.granted = False
+        self.event = threading.Event()
+        # Extra wake-up for asyncio waiters (called under the scheduler lock)
+        self.notify = notify
+
+    def sort_key(self):
+        return self.priority, self.seq
+
+
+class RequestScheduler:
+    """
+    Client-side rate limiting for every call that goes through HttpClient.
+
+    Each request takes a token from its host's bucket and, when it carries
+    a bearer token, from that token's bucket. Requests that can't go yet
+    queue by priority: a queued request holds back any lower-priority
+    request that needs the same bucket, so go-live never waits behind
+    search-as-you-type. The server's own signals win over our guesses:
+    429/503 with Retry-After and exhausted X-RateLimit-*/RateLimit-*
+    headers block the bucket until the given time.
+
+    A request that would wait longer than MAX_WAIT for its priority, or a
+    background request arriving while SHED_DEPTH requests are already
+    queued, fails at once with RequestShed instead of being sent.
+    """
+
+    # (requests per second, burst) per host; hosts not listed are unlimited until they push back
+    HOST_LIMITS = {
+        "api.github.com": (60 / 3600, 10),  # unauthenticated API: 60 an hour per IP
+    }
+    TOKEN_LIMIT = (5.0, 10)
+    MAX_WAIT = {CRITICAL: 30.0, INTERACTIVE: 10.0, BACKGROUND: 2.0}
+    SHED_DEPTH = 16
+    # Block applied for a 429 that doesn't say how long to back off
+    DEFAULT_RETRY_AFTER = 1.0
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._buckets: dict[tuple, _Bucket] = {}
+        self._queue: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------ #
+    #  Admission                                                           #
+    # ------------------------------------------------------------------ #
+
+    def acquire(self, url: str, headers=None, priority: int = INTERACTIVE):
+        """Block until the request may be sent; raises RequestShed if it shouldn't be."""
+        waiter = self._enqueue(url, headers, priority)
+        if waiter is None:
+            return
+        if not waiter.event.wait(self.MAX_WAIT.get(priority)):
+            self._expire(waiter, url)
+
+    async def acquire_async(self, url: str, headers=None, priority: int = INTERACTIVE):
+        """acquire() for coroutines: waits on the event loop instead of blocking a thread."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._enqueue(url, headers, priority, notify)
+        if waiter is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.MAX_WAIT.get(priority))
+        except asyncio.TimeoutError:
+            self._expire(waiter, url)
+
+    def _enqueue(self, url, headers, priority, notify=None) -> _Waiter | None:
+        buckets = self._buckets_for(url, headers)
+        with self._cond:
+            now = time.monotonic()
+            wait = max(bucket.ready_in(now) for bucket in buckets)
+            if wait == 0 and not any(w.priority < priority and self._contended(w, buckets)
+                                     for w in self._queue):
+                for bucket in buckets:
+                    bucket.take()
+                return None
+            max_wait = self.MAX_WAIT.get(priority)
+            if max_wait is not None and wait > max_wait:
+                raise RequestShed(f"Rate limited by {urlsplit(url).hostname}; "
+                                  f"retry in {wait:.0f}s", retry_after=wait)
+            if priority >= BACKGROUND and len(self._queue) >= self.SHED_DEPTH:
+                raise RequestShed(f"{len(self._queue)} requests queued; dropping background request")
+            waiter = _Waiter(priority, next(self._seq), buckets, notify)
+            self._queue.append(waiter)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="request-scheduler")
+                self._thread.start()
+            self._cond.notify()
+            return waiter
+
+    def _expire(self, waiter: _Waiter, url: str):
+        with self._cond:
+            if waiter.granted:
+                return
+            self._queue.remove(waiter)
+            self._cond.notify()
+        raise RequestShed(f"Timed out waiting for the {urlsplit(url).hostname} rate limit")
+
+    @staticmethod
+    def _contended(waiter: _Waiter, buckets) -> bool:
+        """Does `waiter` need one of the rate-limited `buckets`?"""
+        return any(bucket.rate is not None and bucket in waiter.buckets for bucket in buckets)
+
+    def _buckets_for(self, url, headers) -> tuple[_Bucket, ...]:
+        host = urlsplit(url).hostname or ""
+        keys = [("host", host)]
+        authorization = next((v for k, v in (headers or {}).items() if k.lower() == "authorization"), None)
+        if authorization:
+            keys.append(("token", hashlib.sha256(authorization.encode()).hexdigest()))
+        with self._cond:
+            buckets = []
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst = self.HOST_LIMITS.get(host, (None, 1)) if key[0] == "host" else self.TOKEN_LIMIT
+                    bucket = self._buckets[key] = _Bucket(rate, burst)
+                buckets.append(bucket)
+            return tuple(buckets)
+
+    # ------------------------------------------------------------------ #
+    #  Server feedback                                                     #
+    # ------------------------------------------------------------------ #
+
+    def observe(self, url: str, headers, status: int, response_headers) -> float:
+        """
+        Apply the rate-limit signals of a response. Returns how many seconds
+        the request's buckets are now blocked for (0 if none).
+        """
+        delay = self._retry_after(status, response_headers)
+        if not delay:
+            return 0.0
+        buckets = self._buckets_for(url, headers)
+        # A throttled authenticated call is most likely the per-token limit
+        bucket = buckets[-1] if status == 429 else buckets[0]
+        with self._cond:
+            bucket.block(time.monotonic() + delay)
+            self._cond.notify()
+        return delay
+
+    def _retry_after(self, status: int, headers) -> float:
+        value = headers.get("Retry-After")
+        if value and status in (429, 503):
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+            try:
+                return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+            except ValueError:
+                pass
+        if headers.get("RateLimit-Remaining") == "0" and headers.get("RateLimit-Reset"):
+            try:
+                return max(0.0, float(headers["RateLimit-Reset"]))
+            except ValueError:
+                pass
+        return self.DEFAULT_RETRY_AFTER if status == 429 else 0.0
+
+    # ------------------------------------------------------------------ #
+    #  Dispatcher thread                                                   #
+    # ------------------------------------------------------------------ #
+
+    def _run(self):
+        with self._cond:
+            while True:
+                self._cond.wait(self._dispatch())
+
+    def _dispatch(self) -> float | None:
+        """Grant every queued request that can go now; returns seconds until the next may."""
+        now = time.monotonic()
+        held = set()
+        next_wake = None
+        for waiter in sorted(self._queue, key=_Waiter.sort_key):
+            if held & set(waiter.buckets):
+                continue
+            waits = {bucket: bucket.ready_in(now) for bucket in waiter.buckets}
+            wait = max(waits.values())
+            if wait:
+                # Hold back what it is waiting on so nothing less urgent overtakes it
+                held.update(bucket for bucket, w in waits.items() if w)
+                next_wake = wait if next_wake is None else min(next_wake, wait)
+                continue
+            for bucket in waiter.buckets:
+                bucket.take()
+            waiter.granted = True
+            self._queue.remove(waiter)
+            waiter.event.set()
+            if waiter.notify:
+                waiter.notify()
+        return next_wake
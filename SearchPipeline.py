@@ -0,0 +1,109 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SearchPipeline:
+    """
+    Debounced search-as-you-type runner.
+
+    Every keystroke calls `submit(text)`. The actual search only runs once the
+    text has been stable for `debounce` seconds, on a small bounded worker pool.
+    The debounce itself is one long-lived thread that keeps a single deadline:
+    a keystroke only moves the deadline, it never starts a thread or a timer.
+    Each submission gets a sequence number; results from anything but the most
+    recent submission are dropped before `on_result` is called, so a slow reply
+    for "Mine" can never overwrite the suggestions for "Minecraft".
+    """
+
+    def __init__(self, search_fn, on_result, on_error=None,
+                 debounce: float = 0.3, max_workers: int = 2):
+        self._search_fn = search_fn
+        self._on_result = on_result
+        self._on_error = on_error
+        self._debounce = debounce
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="search"
+        )
+        self._lock = threading.Condition()
+        self._seq = 0
+        # (deadline, seq, text) of the search waiting out the debounce
+        self._pending: tuple[float, int, str] | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._future = None
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                          #
+    # ------------------------------------------------------------------ #
+
+    def submit(self, text: str) -> int:
+        """Schedule a search for `text`, superseding anything still pending."""
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._cancel_pending()
+            self._pending = (time.monotonic() + self._debounce, seq, text)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._debounce_loop, daemon=True,
+                                                name="search-debounce")
+                self._thread.start()
+            self._lock.notify()
+        return seq
+
+    def cancel(self):
+        """Drop any pending or in-flight search (e.g. the field was cleared)."""
+        with self._lock:
+            self._seq += 1
+            self._cancel_pending()
+
+    def is_current(self, seq: int) -> bool:
+        return seq == self._seq
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------ #
+    #  Internals                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _cancel_pending(self):
+        """Caller must hold self._lock."""
+        self._pending = None
+        self._lock.notify()
+        if self._future is not None:
+            # Only succeeds if the worker hasn't picked it up yet; a running
+            # request is left to finish and its result is discarded by seq.
+            self._future.cancel()
+            self._future = None
+
+    def _debounce_loop(self):
+        with self._lock:
+            while not self._closed:
+                if self._pending is None:
+                    self._lock.wait()
+                    continue
+                deadline, seq, text = self._pending
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._lock.wait(remaining)
+                    continue
+                self._pending = None
+                if self.is_current(seq):
+                    self._future = self._executor.submit(self._run, seq, text)
+            self._thread = None
+
+    def _run(self, seq: int, text: str):
+        if not self.is_current(seq):
+            return
+        try:
+            result = self._search_fn(text)
+        except Exception as e:
+            if self.is_current(seq) and self._on_error:
+                self._on_error(e)
+            return
+        if self.is_current(seq):
+            self._on_result(result)
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import threading
+import time
+from FileUtils import atomic_write
+
+
+class SessionJournal:
+    """
+    Durable record of streams that were started and not yet ended.
+
+    Every start/end rewrites a small JSON file (sessions.json, next to
+    config.json) via an fsync'd temp-file-and-rename, so a crash or a closed
+    window never loses the id needed to end a stream that is still live.
+    The file only ever holds the currently running streams, which keeps each
+    write to a few hundred bytes.
+
+    Entries carry a SHA-256 fingerprint of the token that started them, so
+    switching tokens never picks up another account's stream. Entries from
+    before fingerprints were recorded match on account alone, and anything
+    older than MAX_AGE is dropped on load.
+    """
+
+    FORMAT_VERSION = 1
+    MAX_AGE = 7 * 24 * 3600
+
+    def __init__(self, path: str = "sessions.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._sessions: dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable session journal {self.path}: {e}")
+            return
+        sessions = data.get("sessions") if isinstance(data, dict) else None
+        if not isinstance(sessions, list):
+            print(f"Ignoring unexpected session journal {self.path} contents")
+            return
+        cutoff = time.time() - self.MAX_AGE
+        for entry in sessions:
+            if not self._valid(entry):
+                print(f"Dropping malformed session journal entry: {entry!r}"[:200])
+                continue
+            if entry["started_at"] >= cutoff:
+                self._sessions[str(entry["id"])] = entry
+
+    @staticmethod
+    def _valid(entry) -> bool:
+        return (isinstance(entry, dict)
+                and entry.get("id") not in (None, "")
+                and isinstance(entry.get("rtmp"), str)
+                and isinstance(entry.get("key"), str)
+                and isinstance(entry.get("started_at"), (int, float)))
+
+    @staticmethod
+    def fingerprint(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _write(self):
+        """Caller must hold self._lock."""
+        payload = {"v": self.FORMAT_VERSION, "sessions": list(self._sessions.values())}
+        atomic_write(self.path, json.dumps(payload, separators=(",", ":")).encode("utf-8"), fsync=True)
+
+    def record_start(self, stream_id, rtmp: str, key: str, account: str | None = None,
+                     token: str | None = None):
+        entry = {
+            "id": stream_id,
+            "rtmp": rtmp,
+            "key": key,
+            "account": account,
+            "token": self.fingerprint(token) if token else None,
+            "started_at": time.time(),
+        }
+        with self._lock:
+            self._sessions[str(stream_id)] = entry
+            self._write()
+
+    def record_end(self, stream_id, token: str | None = None):
+        """Forget a stream; with `token`, only if that token started it."""
+        with self._lock:
+            entry = self._sessions.get(str(stream_id))
+            if entry is None or (token and entry.get("token") != self.fingerprint(token)):
+                return
+            del self._sessions[str(stream_id)]
+            self._write()
+
+    def active(self, account: str | None = ..., token: str | None = None) -> list[dict]:
+        """
+        Running streams, newest first; pass `account` to filter (None = main
+        window) and `token` to keep only streams started with that token.
+        """
+        fingerprint = self.fingerprint(token) if token else None
+        with self._lock:
+            entries = [dict(e) for e in self._sessions.values()
+                       if (account is ... or e.get("account") == account)
+                       and (fingerprint is None or e.get("token") in (None, fingerprint))]
+        return sorted(entries, key=lambda e: e["started_at"], reverse=True)
+
+    def latest(self, account: str | None = None, token: str | None = None) -> dict | None:
+        entries = self.active(account, token)
+        return entries[0] if entries else None
@@ -0,0 +1,150 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.util import find_spec
+
+
+class SessionManager:
+    """
+    Named Streamlabs accounts, each with its own Stream on the shared pool.
+
+    `refresh_all` polls getInfo for every account with up to
+    `max_concurrency` calls in flight, so refreshing N accounts costs about
+    ceil(N / max_concurrency) round trips instead of N sequential ones; pass
+    `max_concurrency` per call to widen the bound. Results land in `status`.
+    With aiohttp installed the polling runs as coroutines on the shared
+    asyncio loop thread instead of one OS thread per in-flight account.
+    """
+
+    # Poll through AsyncStream on the loop thread rather than a thread pool
+    use_async = find_spec("aiohttp") is not None
+
+    def __init__(self, accounts=None, max_concurrency: int = 8):
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._tokens: dict[str, str] = {}
+        self._streams: dict[str, object] = {}
+        self._async_streams: dict[str, object] = {}
+        self.status: dict[str, dict] = {}
+        for account in accounts or []:
+            self.add(account["name"], account["token"])
+
+    # ------------------------------------------------------------------ #
+    #  Accounts                                                            #
+    # ------------------------------------------------------------------ #
+
+    def add(self, name: str, token: str):
+        with self._lock:
+            if self._tokens.get(name) != token:
+                self._streams.pop(name, None)
+                self._async_streams.pop(name, None)
+                self.status.pop(name, None)
+            self._tokens[name] = token
+
+    def remove(self, name: str):
+        with self._lock:
+            self._tokens.pop(name, None)
+            self._streams.pop(name, None)
+            self._async_streams.pop(name, None)
+            self.status.pop(name, None)
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return list(self._tokens)
+
+    def token(self, name: str) -> str:
+        return self._tokens[name]
+
+    def stream(self, name: str):
+        """The account's Stream, created on first use."""
+        with self._lock:
+            stream = self._streams.get(name)
+            if stream is None:
+                from Stream import Stream
+                stream = self._streams[name] = Stream(self._tokens[name], account=name)
+            return stream
+
+    def async_stream(self, name: str):
+        """The account's AsyncStream, created on first use."""
+        with self._lock:
+            stream = self._async_streams.get(name)
+            if stream is None:
+                from AsyncStream import AsyncStream
+                stream = self._async_streams[name] = AsyncStream(self._tokens[name], account=name)
+            return stream
+
+    def to_config(self) -> list[dict]:
+        with self._lock:
+            return [{"name": name, "token": token} for name, token in self._tokens.items()]
+
+    # ------------------------------------------------------------------ #
+    #  Status polling                                                      #
+    # ------------------------------------------------------------------ #
+
+    def refresh(self, name: str) -> dict:
+        """Fetch getInfo for one account and record it in `status`."""
+        try:
+            result = {"info": self.stream(name).getInfo(), "error": None}
+        except Exception as e:
+            result = {"info": None, "error": str(e)}
+        return self._store_status(name, result)
+
+    async def refresh_async(self, name: str) -> dict:
+        """Coroutine version of refresh(), for the asyncio loop."""
+        try:
+            result = {"info": await self.async_stream(name).getInfo(), "error": None}
+        except Exception as e:
+            result = {"info": None, "error": str(e)}
+        return self._store_status(name, result)
+
+    def _store_status(self, name: str, result: dict) -> dict:
+        result["updated"] = time.time()
+        with self._lock:
+            if name in self._tokens:
+                self.status[name] = result
+        return result
+
+    def refresh_all(self, names=None, on_result=None,
+                    max_concurrency: int | None = None) -> dict[str, dict]:
+        """
+        Refresh every (or the given) account concurrently.
+
+        `on_result(name, result)` is called from worker threads as each
+        account completes, so a UI can fill in rows as they arrive.
+        `max_concurrency` overrides the manager's bound for this call.
+        """
+        limit = max_concurrency or self.max_concurrency
+        names = list(names) if names is not None else self.names()
+        if not names:
+            return {}
+        if self.use_async:
+            from AsyncStream import loop_thread
+            return loop_thread().run(self.refresh_all_async(names, on_result, limit))
+        results = {}
+        workers = max(1, min(limit, len(names)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="accounts") as executor:
+            futures = {executor.submit(self.refresh, name): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name] = future.result()
+                if on_result:
+                    on_result(name, results[name])
+        return results
+
+    async def refresh_all_async(self, names=None, on_result=None,
+                                max_concurrency: int | None = None) -> dict[str, dict]:
+        """refresh_all as coroutines: one loop thread, at most `max_concurrency` requests in flight."""
+        import asyncio
+
+        names = list(names) if names is not None else self.names()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
+        results = {}
+
+        async def one(name):
+            async with semaphore:
+                results[name] = await self.refresh_async(name)
+            if on_result:
+                on_result(name, results[name])
+
+        await asyncio.gather(*(one(name) for name in names))
+        return results
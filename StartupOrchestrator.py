@@ -0,0 +1,89 @@
+import os
+import time
+
+
+class StartupOrchestrator:
+    """
+    Fires the independent startup requests (account info, category resolve,
+    update check, ...) at the same time and records how long each one took.
+
+    Phases run through a TaskRunner, so their callbacks land on the GUI thread.
+    Time-to-ready is therefore bounded by the slowest phase rather than the
+    sum of all of them; `report()` gives the per-phase breakdown (shown in
+    the diagnostics panel, and printed when STREAMKEY_DEBUG is set).
+    """
+
+    verbose = bool(os.environ.get("STREAMKEY_DEBUG"))
+
+    def __init__(self, runner, t0: float | None = None):
+        self.runner = runner
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.marks: dict[str, float] = {}      # phase -> ms since t0 when it finished
+        self.durations: dict[str, float] = {}  # phase -> ms spent in the call itself
+        self._phases = []
+        self._pending: set[str] = set()
+        self.on_ready = None
+
+    def mark(self, name: str):
+        """Record a milestone that isn't a background call (e.g. first paint)."""
+        self.marks[name] = (time.perf_counter() - self.t0) * 1000
+
+    def add(self, name: str, fn, *args, on_success=None, on_error=None):
+        # Phases get their own task keys so a user action (e.g. Refresh) can't
+        # supersede one and leave the orchestrator waiting forever.
+        self._phases.append((name, f"startup:{name}", fn, args, on_success, on_error))
+
+    def start(self):
+        self.mark("event_loop")
+        if not self._phases:
+            self._finish()
+            return
+        for name, *_ in self._phases:
+            self._pending.add(name)
+        for name, key, fn, args, on_success, on_error in self._phases:
+            self.runner.submit(
+                key, self._timed(name, fn), *args,
+                on_success=self._completion(name, on_success),
+                on_error=self._completion(name, on_error),
+            )
+        self._phases.clear()
+
+    def report(self) -> str:
+        parts = [f"{name} {ms:.0f} ms" for name, ms in self.marks.items()]
+        calls = [f"{name} {ms:.0f} ms" for name, ms in self.durations.items()]
+        line = "Startup: " + ", ".join(parts)
+        if calls:
+            line += " (calls: " + ", ".join(calls) + ")"
+        return line
+
+    # ------------------------------------------------------------------ #
+    #  Internals                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _timed(self, name, fn):
+        def run(*args):
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self.durations[name] = (time.perf_counter() - start) * 1000
+        return run
+
+    def _completion(self, name, callback):
+        def done(value):
+            self.mark(name)
+            try:
+                if callback:
+                    callback(value)
+            finally:
+                self._pending.discard(name)
+                if not self._pending:
+                    self._finish()
+        return done
+
+    def _finish(self):
+        self.mark("ready")
+        if self.verbose:
+            print(self.report())
+        if self.on_ready:
+            self.on_ready()
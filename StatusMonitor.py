@@ -0,0 +1,100 @@
+import random
+import threading
+
+
+class StatusMonitor:
+    """
+    Background getInfo poller with adaptive intervals.
+
+    While a stream is starting or live the account is polled every
+    `live_interval` seconds. When idle it starts at `idle_interval` and
+    doubles after every unchanged reply up to `max_interval`, snapping back
+    as soon as something changes. Errors back off the same way.
+    Replies (AccountInfo, compared by value) only reach `on_change(info)`
+    when the account state actually differs from what was last seen.
+    `on_change` and `on_error` are called from the monitor thread.
+    """
+
+    def __init__(self, fetch, on_change, on_error=None, live_interval: float = 5.0,
+                 idle_interval: float = 30.0, max_interval: float = 300.0):
+        self.fetch = fetch
+        self.on_change = on_change
+        self.on_error = on_error
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.max_interval = max_interval
+        self._lock = threading.Lock()
+        self._last = None
+        self._live = False
+        self._interval = idle_interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name="status-monitor")
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def set_live(self, live: bool):
+        """Poll fast while a stream is starting/live; wakes the monitor on a change."""
+        with self._lock:
+            changed = live != self._live
+            self._live = live
+            self._interval = self.live_interval if live else self.idle_interval
+        if changed:
+            self._wake.set()
+
+    def observe(self, info):
+        """Record info fetched elsewhere (startup, manual refresh) so it isn't re-reported."""
+        with self._lock:
+            self._last = info
+
+    def reset(self):
+        """Forget the last state (e.g. the token changed) and poll soon."""
+        with self._lock:
+            self._last = None
+            self._interval = self.live_interval if self._live else self.idle_interval
+        self._wake.set()
+
+    # ------------------------------------------------------------------ #
+    #  Monitor thread                                                      #
+    # ------------------------------------------------------------------ #
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                interval = self._interval
+            # A little jitter keeps several instances from polling in lockstep
+            if self._wake.wait(interval * random.uniform(0.9, 1.1)):
+                self._wake.clear()
+                if self._stop.is_set():
+                    return
+            self._poll()
+
+    def _poll(self):
+        try:
+            info = self.fetch()
+        except Exception as e:
+            with self._lock:
+                self._interval = min(self.max_interval, self._interval * 2)
+            if self.on_error:
+                self.on_error(e)
+            return
+        if info is None:
+            return
+
+        with self._lock:
+            changed = info != self._last
+            self._last = info
+            base = self.live_interval if self._live else self.idle_interval
+            if changed or self._live:
+                self._interval = base
+            else:
+                self._interval = min(self.max_interval, self._interval * 2)
+        if changed:
+            self.on_change(info)
@@ -1,45 +1,152 @@
-import requests
+import os
+from CategoryCache import CategoryCache
+from HttpClient import shared_client
+from Instrumentation import redact
+from Models import OTHER, AccountInfo, Category, StreamStart
+from RequestScheduler import CRITICAL, INTERACTIVE
 
 
 class Stream:
-    def __init__(self, token):
-        self.s = requests.session()
-        self.s.headers.update({
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) StreamlabsDesktop/1.17.0 Chrome/122.0.6261.156 Electron/29.3.1 Safari/537.36",
+    # Overridable (env or class attribute) so the app can run against a local mock server
+    API_BASE = os.environ.get("STREAMLABS_API_BASE", "https://streamlabs.com/api/v5").rstrip("/")
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) StreamlabsDesktop/1.17.0 Chrome/122.0.6261.156 Electron/29.3.1 Safari/537.36"
+
+    # Shared by every Stream instance: category results don't depend on the token
+    category_cache = CategoryCache()
+    # Optional persistent CategoryIndex fed from every network search result
+    category_index = None
+    # Optional SessionJournal: started streams are recorded so they can be ended after a restart
+    journal = None
+
+    # (connect, read) timeouts per endpoint; search is interactive so it gives up fast
+    TIMEOUTS = {
+        "search": (3.05, 5),
+        "info": (3.05, 10),
+        "start": (5, 20),
+        "end": (5, 20),
+    }
+    # Scheduler priority per endpoint: going live beats typing, typing beats polling
+    PRIORITIES = {
+        "search": INTERACTIVE,
+        "info": INTERACTIVE,
+        "start": CRITICAL,
+        "end": CRITICAL,
+    }
+
+    def __init__(self, token, account=None):
+        # The pooled transport is shared, so the token travels per request
+        self.s = shared_client()
+        # Saved account name this stream belongs to (None for the main window's token)
+        self.account = account
+        self.token = token
+        self.id = None
+        if self.journal is not None:
+            # Pick up a stream this token left running in a previous run so end() still works
+            running = self.journal.latest(account, token)
+            if running:
+                self.id = running["id"]
+        self.headers = {
+            "user-agent": self.USER_AGENT,
             "authorization": f"Bearer {token}"
-        })
+        }
 
     def search(self, game):
         if not game:
             return []
         game = game[:25] # If the game name exceeds 25 characters, the API will return error 500
-        url = f"https://streamlabs.com/api/v5/slobs/tiktok/info?category={game}"
-        info = self.s.get(url).json()
-        info["categories"].append({"full_name": "Other", "game_mask_id": ""})
-        return info["categories"]
+        categories = self.category_cache.get(game)
+        if categories is None:
+            url = f"{self.API_BASE}/slobs/tiktok/info"
+            response = self.s.get(
+                url, params={"category": game}, headers=self.headers,
+                timeout=self.TIMEOUTS["search"], priority=self.PRIORITIES["search"]
+            )
+            # A throttled or failed search is an HTTP error, not a KeyError on the body
+            response.raise_for_status()
+            info = response.json()
+            categories = self.category_cache.put(game, map(Category.from_json, info["categories"]))
+            if self.category_index is not None:
+                self.category_index.add(categories)
+        return (*categories, OTHER)
 
-    def start(self, title, category, audience_type='0'):
-        url = "https://streamlabs.com/api/v5/slobs/tiktok/stream/start"
+    def resolve_category(self, game):
+        """game_mask_id for an exact category name, or None if the API doesn't know it."""
+        if self.category_index is not None:
+            mask_id = self.category_index.lookup(game)
+            if mask_id:
+                return mask_id
+        for category in self.search(game):
+            if category.full_name == game:
+                return category.game_mask_id
+        return None
+
+    def start(self, title, category, audience_type='0') -> StreamStart | None:
+        url = f"{self.API_BASE}/slobs/tiktok/stream/start"
         files=(
             ('title', (None, title)),
             ('device_platform', (None, 'win32')),
             ('category', (None, category)),
             ('audience_type', (None, audience_type)),
         )
-        response = self.s.post(url, files=files).json()
-        try:
-            self.id = response["id"]
-            return response["rtmp"], response["key"]
-        except KeyError:
-            print("Error: ", response)
-            return None, None
-
-    def end(self):
-        url = f"https://streamlabs.com/api/v5/slobs/tiktok/stream/{self.id}/end"
-        response = self.s.post(url).json()
-        return response["success"]
+        response = self._json(self.s.post(
+            url, files=files, headers=self.headers, timeout=self.TIMEOUTS["start"],
+            priority=self.PRIORITIES["start"]
+        ))
+        started = StreamStart.from_json(response)
+        if started is None:
+            print(f"Stream start failed: {redact(response)}")
+            return None
+        self.id = started.id
+        if self.journal is not None:
+            # The stream is live either way; a failed journal write must not hide its key
+            try:
+                self.journal.record_start(started.id, started.rtmp, started.key, self.account, self.token)
+            except OSError as e:
+                print(f"Could not record stream {started.id} in {self.journal.path}: {e}")
+        return started
+
+    def end(self, stream_id=None):
+        stream_id = stream_id or self.id
+        if not stream_id:
+            return False
+        url = f"{self.API_BASE}/slobs/tiktok/stream/{stream_id}/end"
+        reply = self.s.post(
+            url, headers=self.headers, timeout=self.TIMEOUTS["end"], priority=self.PRIORITIES["end"]
+        )
+        response = self._json(reply)
+        success = bool(response.get("success")) if isinstance(response, dict) else False
+        # A 200 without success means there is nothing to end: the stream is over.
+        # Forget it then too, but only if this token started it.
+        if success or reply.ok:
+            if self.journal is not None:
+                try:
+                    self.journal.record_end(stream_id, None if success else self.token)
+                except OSError as e:
+                    print(f"Could not update {self.journal.path}: {e}")
+            if stream_id == self.id:
+                self.id = None
+        return success
     
-    def getInfo(self):
-        url = "https://streamlabs.com/api/v5/slobs/tiktok/info"
-        response = self.s.get(url).json()
-        return response
\ No newline at end of file
+    def getInfo(self, priority=None) -> AccountInfo:
+        """Account info; pass priority=BACKGROUND for polling so it yields to user actions."""
+        url = f"{self.API_BASE}/slobs/tiktok/info"
+        reply = self.s.get(
+            url, headers=self.headers, timeout=self.TIMEOUTS["info"],
+            priority=self.PRIORITIES["info"] if priority is None else priority
+        )
+        return AccountInfo.from_json(self._json(reply), reply.status_code)
+
+    @staticmethod
+    def _json(response):
+        """
+        The decoded body. Error payloads (e.g. a revoked token) are returned
+        as-is for the caller to interpret; a 429 or a non-JSON error page
+        raises requests.HTTPError instead.
+        """
+        if response.status_code == 429:
+            response.raise_for_status()
+        try:
+            return response.json()
+        except ValueError:
+            response.raise_for_status()
+            raise
\ No newline at end of file
@@ -0,0 +1,286 @@
+"""
+Headless entry point: same Streamlabs operations as the GUI, JSON on stdout.
+
+    python StreamKeyCLI.py info
+    python StreamKeyCLI.py search "Minecraft"
+    python StreamKeyCLI.py start --title "My stream" --game "Minecraft"
+    python StreamKeyCLI.py end [--id 123456]
+    python StreamKeyCLI.py sessions    # streams started and not yet ended
+    python StreamKeyCLI.py token [--web]
+    python StreamKeyCLI.py batch start jobs.json --format csv
+    python StreamKeyCLI.py daemon      # JSON-lines requests on stdin
+
+The token comes from --token, then --account (a saved account name),
+then $STREAMLABS_TOKEN, then config.json.
+Nothing here imports Qt.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+CONFIG_PATH = "config.json"
+JOURNAL_PATH = "sessions.json"
+
+
+def _load_config() -> dict:
+    from ConfigStore import ConfigStore
+    # Goes through the store so older config files are migrated the same way as in the GUI
+    with contextlib.redirect_stdout(sys.stderr):
+        return ConfigStore(CONFIG_PATH).snapshot()
+
+
+class CommandError(Exception):
+    pass
+
+
+class Commands:
+    """The operations shared by one-shot invocations and the daemon loop."""
+
+    def __init__(self, token: str | None = None, account: str | None = None):
+        self.config = _load_config()
+        if account and not token:
+            token = self._account_token(account)
+        else:
+            account = None
+        self.token = token or os.environ.get("STREAMLABS_TOKEN") or self.config.get("token")
+        # Journal label for self.token's streams: the saved account name, None for the main token
+        self.account = account
+        self._streams = {}
+        self._index = None
+        self._sessions = None
+        self._journal = None
+
+    def _account_token(self, name: str) -> str:
+        for account in self.config.get("accounts", []):
+            if account.get("name") == name:
+                return account["token"]
+        raise CommandError(f"Unknown account: {name}")
+
+    def _stream(self, token: str | None = None):
+        from Stream import Stream
+
+        token = token or self.token
+        if not token:
+            raise CommandError("No token: pass --token, set STREAMLABS_TOKEN or save one in config.json")
+        stream = self._streams.get(token)
+        if stream is None:
+            Stream.category_index = self._category_index()
+            Stream.journal = self.journal()
+            account = self.account if token == self.token else None
+            stream = self._streams[token] = Stream(token, account=account)
+        return stream
+
+    def journal(self):
+        if self._journal is None:
+            from SessionJournal import SessionJournal
+            self._journal = SessionJournal(JOURNAL_PATH)
+        return self._journal
+
+    def _category_index(self):
+        if self._index is None:
+            from CategoryIndex import CategoryIndex
+            self._index = CategoryIndex("category_index.json")
+        return self._index
+
+    def _resolve_category(self, stream, game: str) -> str:
+        mask_id = stream.resolve_category(game)
+        if mask_id is None:
+            raise CommandError(f"Unknown category: {game}")
+        return mask_id
+
+    # ------------------------------------------------------------------ #
+    #  Commands                                                            #
+    # ------------------------------------------------------------------ #
+
+    def info(self, token=None):
+        return self._stream(token).getInfo()
+
+    def search(self, query, token=None):
+        return self._stream(token).search(query)
+
+    def start(self, title=None, game=None, category_id=None, mature=False, token=None):
+        stream = self._stream(token)
+        title = title if title is not None else self.config.get("title", "")
+        if category_id is None:
+            game = game if game is not None else self.config.get("game", "")
+            category_id = self._resolve_category(stream, game) if game else ""
+        audience_type = "1" if mature else "0"
+        started = stream.start(title, category_id, audience_type)
+        if started is None:
+            raise CommandError("Failed to start stream")
+        return started
+
+    def end(self, id=None, token=None):
+        stream = self._stream(token)
+        id = id or stream.id
+        if not id:
+            raise CommandError("No running stream recorded; pass --id")
+        return {"id": id, "success": bool(stream.end(id))}
+
+    def sessions(self):
+        return self.journal().active()
+
+    def batch(self, action, jobs, max_concurrency=4, rate=2.0, retries=2):
+        from BatchLive import run_batch
+        from SessionManager import SessionManager
+        from Stream import Stream
+
+        if self._sessions is None:
+            self._sessions = SessionManager(self.config.get("accounts", []))
+            Stream.category_index = self._category_index()
+            Stream.journal = self.journal()
+        return run_batch(self._sessions, jobs, action, max_concurrency, rate, retries)
+
+    def token_cmd(self, web=False):
+        if web:
+            from TokenRetriever import TokenRetriever
+            token = TokenRetriever().retrieve_token()
+        else:
+            from LocalTokenFinder import find_local_token
+            token = find_local_token()
+        if not token:
+            raise CommandError("No token found")
+        return {"token": token}
+
+    def stats(self):
+        """Per-endpoint request timings for this process (useful from the daemon)."""
+        from Instrumentation import recorder
+        return recorder().summary()
+
+    def close(self):
+        if self._index is not None:
+            self._index.save()
+
+
+def _emit(payload):
+    from Models import to_json
+    sys.stdout.write(json.dumps(payload, default=to_json) + "\n")
+    sys.stdout.flush()
+
+
+def run_daemon(commands: Commands):
+    """
+    Serve JSON-lines requests from stdin, one response line per request:
+
+        {"cmd": "start", "title": "...", "game": "...", "request_id": 1}
+        {"request_id": 1, "ok": true, "result": {...}}
+
+    Streams and the HTTP pool stay warm between requests.
+    """
+    handlers = {
+        "info": commands.info,
+        "search": commands.search,
+        "start": commands.start,
+        "end": commands.end,
+        "sessions": commands.sessions,
+        "token": commands.token_cmd,
+        "batch": commands.batch,
+        "stats": commands.stats,
+    }
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.pop("request_id", None)
+            handler = handlers.get(request.pop("cmd", None))
+            if handler is None:
+                raise CommandError(f"Unknown command; expected one of {sorted(handlers)}")
+            with contextlib.redirect_stdout(sys.stderr):
+                result = handler(**request)
+            _emit({"request_id": request_id, "ok": True, "result": result})
+        except Exception as e:
+            _emit({"request_id": request_id, "ok": False, "error": str(e)})
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="StreamLabs TikTok stream key generator (headless)")
+    parser.add_argument("--token", help="Streamlabs API token (default: $STREAMLABS_TOKEN or config.json)")
+    parser.add_argument("--account", help="Use the token of an account saved in config.json")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("info", help="Show account information")
+
+    search = sub.add_parser("search", help="Search game categories")
+    search.add_argument("query")
+
+    start = sub.add_parser("start", help="Start a stream and print the RTMP URL and key")
+    start.add_argument("--title", help="Stream title (default: config.json)")
+    start.add_argument("--game", help="Category name (default: config.json)")
+    start.add_argument("--category-id", help="game_mask_id, skips the category lookup")
+    start.add_argument("--mature", action="store_true", help="Enable mature content")
+
+    end = sub.add_parser("end", help="End a stream")
+    end.add_argument("--id", help="Stream id returned by start (default: the last one started and not ended)")
+
+    sub.add_parser("sessions", help="List streams that were started and not yet ended")
+
+    token = sub.add_parser("token", help="Retrieve a token")
+    token.add_argument("--web", action="store_true", help="Log in through the browser instead of reading Streamlabs' local storage")
+
+    batch = sub.add_parser("batch", help="Start or end streams for several saved accounts at once")
+    batch.add_argument("action", choices=("start", "end"))
+    batch.add_argument("jobs", help='JSON file: [{"account": "...", "title": "...", "game": "..."}, ...]')
+    batch.add_argument("--format", choices=("json", "csv"), default="json")
+    batch.add_argument("--output", help="Write results to this file instead of stdout")
+    batch.add_argument("--concurrency", type=int, default=4)
+    batch.add_argument("--rate", type=float, default=2.0, help="Max API calls per second")
+    batch.add_argument("--retries", type=int, default=2)
+
+    sub.add_parser("daemon", help="Serve JSON-lines requests on stdin")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        commands = Commands(args.token, args.account)
+    except CommandError as e:
+        _emit({"error": str(e)})
+        return 1
+    try:
+        if args.command == "daemon":
+            run_daemon(commands)
+            return 0
+        # Library code still print()s progress; keep stdout clean for JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            if args.command == "info":
+                result = commands.info()
+            elif args.command == "search":
+                result = commands.search(args.query)
+            elif args.command == "start":
+                result = commands.start(args.title, args.game, args.category_id, args.mature)
+            elif args.command == "end":
+                result = commands.end(args.id)
+            elif args.command == "sessions":
+                result = commands.sessions()
+            elif args.command == "batch":
+                with open(args.jobs, "r") as file:
+                    jobs = json.load(file)
+                result = commands.batch(args.action, jobs, args.concurrency, args.rate, args.retries)
+            else:
+                result = commands.token_cmd(args.web)
+        if args.command == "batch":
+            from BatchLive import to_csv, to_json
+            text = to_csv(result) if args.format == "csv" else to_json(result)
+            if args.output:
+                with open(args.output, "w", newline="") as file:
+                    file.write(text)
+            else:
+                sys.stdout.write(text if text.endswith("\n") else text + "\n")
+            return 0 if all(r["ok"] for r in result) else 2
+        _emit(result)
+        return 0
+    except Exception as e:
+        _emit({"error": str(e)})
+        return 1
+    finally:
+        commands.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
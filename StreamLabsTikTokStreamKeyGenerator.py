@@ -1,46 +1,75 @@
-import glob
-import os
 import platform
-import re
 import sys
-import json
 import threading
+import time
 import traceback
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QGroupBox, QPushButton, QLineEdit, QLabel, QCheckBox,
                               QListWidget, QMessageBox, QListWidgetItem, QSizePolicy)
 from PySide6.QtCore import Signal, QTimer
 from PySide6.QtGui import QDesktopServices
-from Stream import Stream
-from TokenRetriever import TokenRetriever
-from Updater import VersionChecker
-from packaging import version
+from SearchPipeline import SearchPipeline
+from TaskRunner import TaskRunner
+from StartupOrchestrator import StartupOrchestrator
+from SessionJournal import SessionJournal
+from ConfigStore import ConfigStore
+from TokenHealth import TokenHealth, INVALID
+
+# Networking (Stream/requests), OAuth (TokenRetriever), the leveldb readers and
+# the updater are imported on first use so none of them delay the first paint.
 
 class StreamApp(QMainWindow):
-    update_suggestions = Signal(list)
-    update_ui = Signal()
+    update_suggestions = Signal(object)  # sequence of Category
+    update_ui = Signal(object)  # AccountInfo
     _token_ready = Signal(str)
     _token_error = Signal(str)
+    _token_health_changed = Signal(str, str)
+    _search_error = Signal(str)
+    _save_error = Signal(str)
     _restore_local_btn = Signal()
     _restore_online_btn = Signal()
 
-    def __init__(self):
+    def __init__(self, t0: float | None = None):
         super().__init__()
+        self.startup = None
+        self._t0 = time.perf_counter() if t0 is None else t0
         self.stream = None
+        self.token_watcher = None
+        self.status_monitor = None
+        self.token_health = TokenHealth(self._validate_token, self._token_health_changed.emit)
+        self.config = ConfigStore(
+            "config.json",
+            on_error=lambda e: self._save_error.emit(f"Failed to save {self.config.path}: {e}"),
+        )
+        self._sessions = None
+        self.journal = SessionJournal("sessions.json")
+        self.accounts_dialog = None
+        self.diagnostics_dialog = None
         self.game_mask_id = ""
+        self.tasks = TaskRunner(self)
+        self.tasks.busy_changed.connect(self.handle_busy_changed)
+        self._category_index = None
+        self.search_pipeline = SearchPipeline(
+            self.search_games,
+            self.update_suggestions.emit,
+            lambda e: self._search_error.emit(f"Game search failed: {str(e)}"),
+        )
         self.init_ui()
         self.load_config()
-        
-        QTimer.singleShot(3000, lambda: [
-            self.show_donation_reminder(),
-            QTimer.singleShot(3000, self.check_updates_on_startup)
-        ])
+        self.restore_live_session()
+
+        # Network work starts as soon as the event loop runs, i.e. after first paint
+        QTimer.singleShot(0, self.run_startup)
+        QTimer.singleShot(3000, self.show_donation_reminder)
 
         # Connect signals
         self.update_suggestions.connect(self.update_suggestions_list)
         self.update_ui.connect(self.handle_ui_update)
         self._token_ready.connect(self._apply_token)
         self._token_error.connect(lambda msg: QMessageBox.critical(self, "Error", msg))
+        self._token_health_changed.connect(self.handle_token_health)
+        self._search_error.connect(lambda msg: QMessageBox.critical(self, "Search Error", msg))
+        self._save_error.connect(lambda msg: QMessageBox.critical(self, "Save Error", msg))
         self._restore_local_btn.connect(self._do_restore_local_btn)
         self._restore_online_btn.connect(self._do_restore_online_btn)
 
@@ -165,11 +194,11 @@ class StreamApp(QMainWindow):
         token_layout.addLayout(live_row)
         
         # Refresh account info button
-        refresh_btn = QPushButton("Refresh Account Info")
-        refresh_btn.setFixedHeight(30)
-        refresh_btn.setToolTip("Refresh account information")
-        refresh_btn.clicked.connect(self.refresh_account_info)
-        token_layout.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("Refresh Account Info")
+        self.refresh_btn.setFixedHeight(30)
+        self.refresh_btn.setToolTip("Refresh account information")
+        self.refresh_btn.clicked.connect(self.refresh_account_info)
+        token_layout.addWidget(self.refresh_btn)
 
         # Add stretch to prevent expansion
         token_layout.addStretch()
@@ -199,12 +228,9 @@ class StreamApp(QMainWindow):
         self.game_category.textChanged.connect(self.handle_game_search)
         stream_layout.addWidget(self.game_category)
 
-        # Suggestions List
-        self.suggestions_list = QListWidget()
-        self.suggestions_list.hide()
-        self.suggestions_list.setFixedHeight(100)  # Limit height of suggestions
-        self.suggestions_list.itemClicked.connect(self.handle_suggestion_selected)
-        stream_layout.addWidget(self.suggestions_list)
+        # Suggestions List (built on first use, see _ensure_suggestions_list)
+        self.suggestions_list = None
+        self._stream_layout = stream_layout
 
         # Mature Checkbox
         self.mature_checkbox = QCheckBox("Enable mature content")
@@ -291,6 +317,16 @@ class StreamApp(QMainWindow):
         self.donate_btn.clicked.connect(lambda: QDesktopServices.openUrl("https://buymeacoffee.com/loukious"))
         bottom_buttons.addWidget(self.donate_btn)
 
+        self.accounts_btn = QPushButton("Accounts")
+        self.accounts_btn.setToolTip("Manage multiple accounts")
+        self.accounts_btn.clicked.connect(self.open_accounts)
+        bottom_buttons.addWidget(self.accounts_btn)
+
+        self.diagnostics_btn = QPushButton("Diagnostics")
+        self.diagnostics_btn.setToolTip("Request timings and errors per endpoint")
+        self.diagnostics_btn.clicked.connect(self.open_diagnostics)
+        bottom_buttons.addWidget(self.diagnostics_btn)
+
         self.monitor_btn = QPushButton("Open Live Monitor")
         self.monitor_btn.clicked.connect(self.open_live_monitor)
         bottom_buttons.addWidget(self.monitor_btn)
@@ -310,18 +346,88 @@ class StreamApp(QMainWindow):
         self.go_live_btn.setEnabled(bool(self.token_entry.text()))
 
     def load_config(self):
-        try:
-            with open("config.json", "r") as file:
-                data = json.load(file)
-        except:
-            data = {}
-        self.token_entry.setText(data.get("token", ""))
-        self.stream_title.setText(data.get("title", ""))
-        self.game_category.setText(data.get("game", ""))
-        self.mature_checkbox.setChecked(data.get("audience_type", "0") == "1")
-        self.suppress_donation_reminder = data.get("suppress_donation_reminder", False)
-
-        self.refresh_account_info()
+        self.token_entry.setText(self.config.get("token", ""))
+        self.stream_title.setText(self.config.get("title", ""))
+        self.game_category.setText(self.config.get("game", ""))
+        self.mature_checkbox.setChecked(self.config.get("audience_type", "0") == "1")
+        self.suppress_donation_reminder = self.config.get("suppress_donation_reminder", False)
+
+    @property
+    def sessions(self):
+        """Saved accounts, only read from the config when first needed."""
+        if self._sessions is None:
+            from SessionManager import SessionManager
+            self._sessions = SessionManager(self.config.get("accounts", []))
+        return self._sessions
+
+    def run_startup(self):
+        """Launch account info, category resolve and update check concurrently."""
+        self.startup = StartupOrchestrator(self.tasks, self._t0)
+        token = self.token_entry.text()
+        game = self.game_category.text()
+        self.game_mask_id = self.category_index.lookup(game) or ""
+        if token:
+            self.stream = self._new_stream(token)
+            self.startup.add(
+                "account", self.stream.getInfo,
+                on_success=self.show_account_info,
+                on_error=lambda e: QMessageBox.critical(
+                    self, "Error", f"Failed to load account info: {str(e)}"
+                ),
+            )
+            if game and not self.game_mask_id:
+                self.startup.add(
+                    "category", self.stream.search, game,
+                    on_success=lambda categories: self._set_game_mask_id(game, categories),
+                    on_error=lambda e: print(f"Startup category resolve failed: {e}"),
+                )
+        self.startup.add("update", self._check_update,
+                         on_success=self.show_update_prompt)
+        self.startup.start()
+
+    @property
+    def category_index(self):
+        """The on-disk category index, loaded on first access."""
+        if self._category_index is None:
+            from CategoryIndex import CategoryIndex
+            self._category_index = CategoryIndex("category_index.json")
+            threading.Thread(target=self._category_index.warm, daemon=True).start()
+        return self._category_index
+
+    def _new_stream(self, token):
+        from Stream import Stream
+        Stream.category_index = self.category_index
+        Stream.journal = self.journal
+        return Stream(token)
+
+    def _switch_stream(self, token):
+        """Point self.stream at `token`; the monitor forgets the previous token's state."""
+        previous = self.stream
+        self.stream = self._new_stream(token)
+        if self.status_monitor is not None and (previous is None or previous.token != token):
+            self.status_monitor.reset()
+
+    def restore_live_session(self):
+        """Show a stream left running by a previous run so it can still be ended."""
+        messages = []
+        token = self.token_entry.text()
+        running = self.journal.latest(token=token) if token else None
+        if running:
+            self.stream_url.setText(running["rtmp"])
+            self.stream_key.setText(running["key"])
+            self.end_live_btn.setEnabled(True)
+            self.go_live_btn.setEnabled(False)
+            messages.append("Restored a stream still live from the last session.")
+        others = len(self.journal.active()) - (1 if running else 0)
+        if others:
+            messages.append(f"{others} saved account stream(s) still live — see Accounts to end them.")
+        if messages:
+            self.statusBar().showMessage(" ".join(messages), 10000)
+
+    def _check_update(self):
+        """Runs on a startup worker; usually answered from update_check.json or with a 304."""
+        from Updater import VersionChecker
+        return VersionChecker.check_update(self.config.get("update_check_interval"))
 
     def save_config(self, show_message=True):
         data = {
@@ -329,42 +435,122 @@ class StreamApp(QMainWindow):
             "game": self.game_category.text(),
             "audience_type": "1" if self.mature_checkbox.isChecked() else "0",
             "token": self.token_entry.text(),
-            "suppress_donation_reminder": self.suppress_donation_reminder
+            "suppress_donation_reminder": self.suppress_donation_reminder,
         }
-        with open("config.json", "w") as file:
-            json.dump(data, file)
+        if self._sessions is not None:
+            data["accounts"] = self._sessions.to_config()
+        # Coalesced and written off the GUI thread; untouched keys are kept as loaded
+        self.config.update(data)
         if show_message:
+            # Write now on a worker and confirm only once it is on disk
+            self.tasks.submit("save", self._write_config, on_success=self._config_saved)
+        elif self._category_index is not None:
+            self.tasks.submit("save_index", self._save_category_index)
+
+    def _write_config(self):
+        """Worker thread: write both the config and the category index; False if either failed."""
+        return self.config.flush() & self._save_category_index()
+
+    def _save_category_index(self):
+        """Failures are reported through _save_error (safe from any thread)."""
+        if self._category_index is None:
+            return True
+        try:
+            self._category_index.save()
+        except OSError as e:
+            print(f"Failed to save {self._category_index.path}: {e}")
+            self._save_error.emit(f"Failed to save {self._category_index.path}: {e}")
+            return False
+        return True
+
+    def _config_saved(self, saved):
+        if saved:
             QMessageBox.information(self, "Config Saved", "Configuration saved successfully!")
 
     def load_account_info(self):
         if self.stream:
-            try:
-                info = self.stream.getInfo()
-                user = info.get("user", {})
-                self.tiktok_username.setText(user.get("username", "Unknown"))
-                
-                app_status = info.get("application_status", {})
-                self.app_status.setText(app_status.get("status", "Unknown"))
-                
-                self.can_go_live.setText(str(info.get("can_be_live", False)))
-                
-                if not info.get("can_be_live", False):
-                    self.stream_title.setEnabled(False)
-                    self.game_category.setEnabled(False)
-                    self.mature_checkbox.setEnabled(False)
-                    self.go_live_btn.setEnabled(False)
-                else:
-                    self.stream_title.setEnabled(True)
-                    self.game_category.setEnabled(True)
-                    self.mature_checkbox.setEnabled(True)
-                    self.go_live_btn.setEnabled(True)
+            self.tasks.submit(
+                "account", self.stream.getInfo,
+                on_success=self.show_account_info,
+                on_error=lambda e: QMessageBox.critical(
+                    self, "Error", f"Failed to load account info: {str(e)}"
+                ),
+            )
+
+    def _start_status_monitor(self):
+        from StatusMonitor import StatusMonitor
+        self.status_monitor = StatusMonitor(
+            self._poll_account_info,
+            self.update_ui.emit,
+            lambda e: print(f"Status refresh failed: {e}"),
+        )
+        self.status_monitor.set_live(self.end_live_btn.isEnabled())
+        self.status_monitor.start()
+
+    def _poll_account_info(self):
+        """Runs on the monitor thread; reads self.stream late so token switches are followed."""
+        from RequestScheduler import BACKGROUND
+        stream = self.stream
+        return stream.getInfo(priority=BACKGROUND) if stream else None
+
+    @staticmethod
+    def _validate_token(token):
+        """Runs on a TokenHealth worker."""
+        from RequestScheduler import BACKGROUND
+        from Stream import Stream
+        return Stream(token).getInfo(priority=BACKGROUND)
+
+    def handle_token_health(self, token, state):
+        if state != INVALID or token != self.token_entry.text():
+            return
+        self.go_live_btn.setEnabled(False)
+        self.statusBar().showMessage("Token expired or revoked — load a new one.")
+        QMessageBox.warning(
+            self, "Token Invalid",
+            "Streamlabs no longer accepts this token. Use \"Load from PC\" or \"Load from Web\" to get a new one.",
+        )
+
+    def show_account_info(self, info):
+        if self.status_monitor is None:
+            self._start_status_monitor()
+        self.status_monitor.observe(info)
+        # Every account fetch doubles as a token check; keep it fresh for go-live
+        token = self.token_entry.text()
+        self.token_health.record(token, info)
+        self.token_health.watch(token)
+
+        self.tiktok_username.setText(info.username or "Unknown")
+        self.app_status.setText(info.application_status or "Unknown")
+        self.can_go_live.setText(str(info.can_be_live))
+
+        if not info.can_be_live:
+            self.stream_title.setEnabled(False)
+            self.game_category.setEnabled(False)
+            self.mature_checkbox.setEnabled(False)
+            self.go_live_btn.setEnabled(False)
+        else:
+            self.stream_title.setEnabled(True)
+            self.game_category.setEnabled(True)
+            self.mature_checkbox.setEnabled(True)
+            # Polling reports can arrive mid-stream; only offer Go Live when nothing is live
+            self.go_live_btn.setEnabled(not self.tasks.is_busy("start")
+                                        and not self.end_live_btn.isEnabled())
+
+    def handle_busy_changed(self, key, busy):
+        """Reflect background request state on the control that started it."""
+        if key in ("account", "startup:account"):
+            self.refresh_btn.setEnabled(not busy)
+            self.refresh_btn.setText("Refreshing…" if busy else "Refresh Account Info")
+        elif key == "start":
+            self.go_live_btn.setText("Starting…" if busy else "Go Live")
+        elif key == "end":
+            self.end_live_btn.setText("Ending…" if busy else "End Live")
+        elif key == "mask" and busy:
+            self.statusBar().showMessage("Resolving category…", 3000)
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load account info: {str(e)}")
-    
     def refresh_account_info(self):
         if self.token_entry.text():
-            self.stream = Stream(self.token_entry.text())
+            self._switch_stream(self.token_entry.text())
             self.load_account_info()
             self.fetch_game_mask_id(self.game_category.text())
         self.save_config(False)
@@ -393,6 +579,7 @@ class StreamApp(QMainWindow):
 
             if token:
                 self._token_ready.emit(token)
+                self._watch_local_token(token)
             else:
                 self._token_error.emit(
                     "No API Token found locally. Make sure Streamlabs is installed "
@@ -401,42 +588,31 @@ class StreamApp(QMainWindow):
 
         threading.Thread(target=_run, daemon=True).start()
 
+    def _watch_local_token(self, token: str):
+        """Keep following Streamlabs' storage so a re-login there updates the token here."""
+        if self.token_watcher is None:
+            from LocalTokenWatcher import LocalTokenWatcher
+            self.token_watcher = LocalTokenWatcher(self._token_ready.emit, current_token=token)
+            self.token_watcher.start()
+
     def _find_local_token(self) -> str | None:
         """Blocking file scan — runs on a worker thread."""
-        if platform.system() == 'Windows':
-            path_pattern = os.path.expandvars(
-                r'%appdata%\slobs-client\Local Storage\leveldb\*.log'
-            )
-        elif platform.system() == 'Darwin':
-            path_pattern = os.path.expanduser(
-                '~/Library/Application Support/slobs-client/Local Storage/leveldb/*.log'
-            )
-        else:
+        from LocalTokenFinder import find_local_token, leveldb_dir
+
+        if leveldb_dir() is None:
             QTimer.singleShot(0, lambda: QMessageBox.critical(
                 self, "Error", "Unsupported operating system for local token retrieval."
             ))
             return None
 
-        files = sorted(glob.glob(path_pattern), key=os.path.getmtime, reverse=True)
-        token_pattern = re.compile(r'"apiToken":"([a-f0-9]+)"', re.IGNORECASE)
-
-        for file in files:
-            try:
-                with open(file, 'rb') as f:
-                    content = f.read().decode('utf-8', errors='ignore')
-                content = re.sub(r'[\x00]', '', content)
-                matches = token_pattern.findall(content)
-                if matches:
-                    return matches[-1]
-            except Exception as e:
-                print(f"Error reading {file}: {e}")
-
-        return None
+        return find_local_token()
 
     def fetch_online_token(self):
         self.load_online_btn.setEnabled(False)
         self.load_online_btn.setText("Waiting for login…")
 
+        from TokenRetriever import TokenRetriever
+
         retriever = TokenRetriever()
 
         def _run():
@@ -459,79 +635,149 @@ class StreamApp(QMainWindow):
     def _apply_token(self, token: str):
         """Apply a freshly retrieved token — always called on the GUI thread."""
         self.token_entry.setText(token)
-        self.stream = Stream(token)
+        self._switch_stream(token)
         self.load_account_info()
         self.fetch_game_mask_id(self.game_category.text())
 
     def fetch_game_mask_id(self, game_name):
+        mask_id = self.category_index.lookup(game_name)
+        if mask_id:
+            self.tasks.cancel("mask")
+            self.game_mask_id = mask_id
+            return
         if self.stream:
-            try:
-                categories = self.stream.search(game_name)
-                for category in categories:
-                    if category['full_name'] == game_name:
-                        self.game_mask_id = category['game_mask_id']
-                        return
-                self.game_mask_id = ""
-            except Exception as e:
-                QMessageBox.warning(self, "Search Error", f"Failed to search games: {str(e)}")
+            self.tasks.submit(
+                "mask", self.stream.search, game_name,
+                on_success=lambda categories: self._set_game_mask_id(game_name, categories),
+                on_error=lambda e: QMessageBox.warning(
+                    self, "Search Error", f"Failed to search games: {str(e)}"
+                ),
+            )
+
+    def _set_game_mask_id(self, game_name, categories):
+        for category in categories:
+            if category.full_name == game_name:
+                self.game_mask_id = category.game_mask_id
+                return
+        self.game_mask_id = ""
 
     def handle_game_search(self, text):
         if text and self.stream:
-            threading.Thread(target=self.search_games, args=(text,)).start()
+            # Render what we already know from disk, then refine with the API;
+            # if the index is busy (warm-up) the API answer alone will do
+            cached = self.category_index.suggest(text, blocking=False)
+            if cached:
+                self.update_suggestions_list(cached)
+            self.search_pipeline.submit(text)
         else:
-            self.suggestions_list.hide()
+            self.search_pipeline.cancel()
+            if self.suggestions_list:
+                self.suggestions_list.hide()
 
     def search_games(self, text):
-        try:
-            categories = self.stream.search(text)
-            self.update_suggestions.emit(categories)
-        except Exception as e:
-            QMessageBox.critical(self, "Search Error", f"Game search failed: {str(e)}")
+        """Runs on a search pipeline worker; results are delivered via update_suggestions."""
+        return self.stream.search(text)
+
+    def _ensure_suggestions_list(self):
+        if self.suggestions_list is None:
+            self.suggestions_list = QListWidget()
+            self.suggestions_list.hide()
+            self.suggestions_list.setFixedHeight(100)  # Limit height of suggestions
+            self.suggestions_list.itemClicked.connect(self.handle_suggestion_selected)
+            position = self._stream_layout.indexOf(self.game_category) + 1
+            self._stream_layout.insertWidget(position, self.suggestions_list)
+        return self.suggestions_list
 
     def update_suggestions_list(self, categories):
+        self._ensure_suggestions_list()
         self.suggestions_list.clear()
         for category in categories:
-            self.suggestions_list.addItem(QListWidgetItem(category['full_name']))
+            self.suggestions_list.addItem(QListWidgetItem(category.full_name))
         self.suggestions_list.setVisible(bool(categories))
 
     def handle_suggestion_selected(self, item):
         self.game_category.setText(item.text())
+        # setText re-triggers handle_game_search; the pick is final, so drop it
+        self.search_pipeline.cancel()
         self.fetch_game_mask_id(item.text())
         self.suggestions_list.hide()
 
     def start_stream(self):
-        try:
-            audience_type = "1" if self.mature_checkbox.isChecked() else "0"
-            stream_url, stream_key = self.stream.start(
-                self.stream_title.text(),
-                self.game_mask_id,
-                audience_type
-            )
-            
-            if stream_url and stream_key:
-                self.stream_url.setText(stream_url)
-                self.stream_key.setText(stream_key)
-                self.end_live_btn.setEnabled(True)
-                self.go_live_btn.setEnabled(False)
-                QMessageBox.information(self, "Live Started", "Stream started successfully!")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to start stream!")
+        token = self.token_entry.text()
+        if not token:
+            QMessageBox.critical(self, "Error", "Failed to start stream: no token loaded.")
+            return
+        if self.token_health.status(token) == INVALID:
+            self.handle_token_health(token, INVALID)
+            return
+        # Never block go-live on validation; just make sure the next answer is fresh
+        self.token_health.refresh(token)
+        if self.stream is None or self.stream.token != token:
+            # A pasted token only gets a Stream on Enter; go-live shouldn't depend on that
+            self._switch_stream(token)
+        audience_type = "1" if self.mature_checkbox.isChecked() else "0"
+        self.tasks.submit(
+            "start", self.stream.start,
+            self.stream_title.text(),
+            self.game_mask_id,
+            audience_type,
+            on_success=self._on_stream_started,
+            on_error=self._on_stream_start_failed,
+        )
+        self.go_live_btn.setEnabled(False)
+        self._set_monitor_live(True)
+
+    def _on_stream_started(self, result):
+        if result is not None:
+            self.stream_url.setText(result.rtmp)
+            self.stream_key.setText(result.key)
+            self.end_live_btn.setEnabled(True)
+            self.go_live_btn.setEnabled(False)
+            QMessageBox.information(self, "Live Started", "Stream started successfully!")
+        else:
+            self._set_monitor_live(False)
+            self.go_live_btn.setEnabled(True)
+            QMessageBox.critical(self, "Error", "Failed to start stream!")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to start stream: {str(e)}")
+    def _on_stream_start_failed(self, e):
+        self._set_monitor_live(False)
+        self.go_live_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to start stream: {str(e)}")
 
     def end_stream(self):
-        try:
-            if self.stream.end():
-                self.stream_url.clear()
-                self.stream_key.clear()
-                self.end_live_btn.setEnabled(False)
-                self.go_live_btn.setEnabled(True)
+        self.end_live_btn.setEnabled(False)
+        if self.stream is None or not self.stream.id:
+            self._on_stream_ended(False)
+            return
+        self.tasks.submit(
+            "end", self.stream.end,
+            on_success=self._on_stream_ended,
+            on_error=self._on_stream_end_failed,
+        )
+
+    def _on_stream_ended(self, success):
+        if success or self.stream is None or not self.stream.id:
+            # Ended, or the API says there is nothing left to end and the stream was forgotten
+            self.stream_url.clear()
+            self.stream_key.clear()
+            self.end_live_btn.setEnabled(False)
+            self.go_live_btn.setEnabled(True)
+            self._set_monitor_live(False)
+            if success:
                 QMessageBox.information(self, "Live Ended", "Stream ended successfully!")
             else:
-                QMessageBox.critical(self, "Error", "Failed to end stream!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to end stream: {str(e)}")
+                QMessageBox.warning(self, "Live Ended", "The stream is no longer live.")
+        else:
+            self.end_live_btn.setEnabled(True)
+            QMessageBox.critical(self, "Error", "Failed to end stream!")
+
+    def _on_stream_end_failed(self, e):
+        self.end_live_btn.setEnabled(self.stream is not None and bool(self.stream.id))
+        QMessageBox.critical(self, "Error", f"Failed to end stream: {str(e)}")
+
+    def _set_monitor_live(self, live):
+        if self.status_monitor:
+            self.status_monitor.set_live(live)
 
     def copy_to_clipboard(self, widget):
         QApplication.clipboard().setText(widget.text())
@@ -550,11 +796,9 @@ class StreamApp(QMainWindow):
         msg.exec()
 
 
-    def check_updates_on_startup(self):
-        """Non-blocking update check with GUI notification"""
-        update_info = VersionChecker.check_update()
-
-        if update_info and version.parse(update_info["latest"]) > version.parse(update_info["current"]):
+    def show_update_prompt(self, update_info):
+        """GUI notification for the background update check (update_info is only set for newer releases)"""
+        if update_info:
             msg = QMessageBox(self)
             msg.setWindowTitle("Update Available")
             msg.setText(
@@ -600,14 +844,55 @@ class StreamApp(QMainWindow):
         if msg.clickedButton() == donate_btn:
             QDesktopServices.openUrl("https://buymeacoffee.com/loukious")
 
+    def open_accounts(self):
+        if self.accounts_dialog is None:
+            from AccountsDialog import AccountsDialog
+            self.accounts_dialog = AccountsDialog(self.sessions, self.tasks, self.batch_job_defaults,
+                                                  self.journal, self)
+            self.accounts_dialog.account_selected.connect(self._apply_token)
+            self.accounts_dialog.accounts_changed.connect(lambda: self.save_config(False))
+        self.accounts_dialog.show()
+        self.accounts_dialog.raise_()
+
+    def open_diagnostics(self):
+        if self.diagnostics_dialog is None:
+            from DiagnosticsDialog import DiagnosticsDialog
+            self.diagnostics_dialog = DiagnosticsDialog(self, self.startup)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+
+    def batch_job_defaults(self):
+        return {
+            "title": self.stream_title.text(),
+            "category": self.game_mask_id,
+            "mature": self.mature_checkbox.isChecked(),
+        }
+
     def open_live_monitor(self):
         QDesktopServices.openUrl("https://livecenter.tiktok.com/live_monitor?lang=en-US")
 
-    def handle_ui_update(self):
-        self.load_account_info()
+    def handle_ui_update(self, info):
+        """Account state changed in the background (StatusMonitor)."""
+        self.show_account_info(info)
+
+    def closeEvent(self, event):
+        if self.token_watcher:
+            self.token_watcher.stop()
+        if self.status_monitor:
+            self.status_monitor.stop()
+        self.token_health.shutdown()
+        self.tasks.cancel_all()
+        self.search_pipeline.shutdown()
+        async_stream = sys.modules.get("AsyncStream")
+        if async_stream is not None:
+            async_stream.stop_loop_thread()
+        self._save_category_index()
+        self.config.flush()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
+    t0 = time.perf_counter()
     app = QApplication(sys.argv)
-    window = StreamApp()
+    window = StreamApp(t0)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
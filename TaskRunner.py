@@ -0,0 +1,121 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class _TaskSignals(QObject):
+    done = Signal(object, object, object)  # task, result, error
+
+
+class _Task(QRunnable):
+    def __init__(self, key, fn, args, kwargs, on_success, on_error):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.on_success = on_success
+        self.on_error = on_error
+        self.cancelled = False
+        self.future = None  # set for coroutine tasks running on the asyncio loop thread
+        self.signals = _TaskSignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.done.emit(self, None, e)
+        else:
+            self.signals.done.emit(self, result, None)
+
+    def report(self, future):
+        """Done-callback for coroutine tasks (runs on the loop thread; the signal is queued)."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        self.signals.done.emit(self, None if error else future.result(), error)
+
+
+class TaskRunner(QObject):
+    """
+    Runs blocking calls (HTTP, disk) on a QThreadPool and hands the outcome
+    back on the GUI thread.
+
+    Tasks are keyed: submitting under a key that is still running supersedes
+    the old task, whose result is then silently dropped. `busy_changed` lets
+    the window show a loading state per key.
+    """
+
+    busy_changed = Signal(str, bool)
+
+    def __init__(self, parent=None, max_threads: int = 4):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._active: dict[str, _Task] = {}
+        self._running: set[_Task] = set()  # keeps wrappers alive until they report back
+
+    def submit(self, key: str, fn, *args, on_success=None, on_error=None, **kwargs):
+        """Run fn(*args, **kwargs) off the GUI thread, superseding any task under `key`."""
+        self.cancel(key, notify=False)
+        task = _Task(key, fn, args, kwargs, on_success, on_error)
+        task.signals.done.connect(self._on_done)
+        self._active[key] = task
+        self._running.add(task)
+        self.busy_changed.emit(key, True)
+        self.pool.start(task)
+        return task
+
+    def submit_async(self, key: str, coro_fn, *args, on_success=None, on_error=None, **kwargs):
+        """Like submit(), but awaits coro_fn(*args, **kwargs) on the shared asyncio loop thread."""
+        from AsyncStream import loop_thread
+
+        self.cancel(key, notify=False)
+        task = _Task(key, coro_fn, args, kwargs, on_success, on_error)
+        task.signals.done.connect(self._on_done)
+        self._active[key] = task
+        self._running.add(task)
+        self.busy_changed.emit(key, True)
+        task.future = loop_thread().submit(coro_fn(*args, **kwargs))
+        task.future.add_done_callback(task.report)
+        return task
+
+    def cancel(self, key: str, notify: bool = True):
+        task = self._active.pop(key, None)
+        if task is None:
+            return
+        task.cancelled = True
+        # Its result is dropped anyway; don't let the callbacks' closures outlive the cancel
+        task.on_success = task.on_error = None
+        if task.future is not None:
+            if task.future.cancel():
+                self._running.discard(task)
+        elif self.pool.tryTake(task):
+            self._running.discard(task)
+        if notify:
+            self.busy_changed.emit(key, False)
+
+    def cancel_all(self):
+        for key in list(self._active):
+            self.cancel(key)
+        # Tasks still running won't be waited for (e.g. at shutdown); the pool
+        # keeps its own reference to them, so stop tracking them here
+        self._running.clear()
+
+    def is_busy(self, key: str) -> bool:
+        return key in self._active
+
+    def _on_done(self, task, result, error):
+        self._running.discard(task)
+        if task.cancelled or self._active.get(task.key) is not task:
+            return
+        del self._active[task.key]
+        self.busy_changed.emit(task.key, False)
+        if error is not None:
+            if task.on_error:
+                task.on_error(error)
+            else:
+                print(f"Background task '{task.key}' failed: {error}")
+        elif task.on_success:
+            task.on_success(result)
@@ -0,0 +1,148 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+VALID = "valid"
+INVALID = "invalid"
+UNKNOWN = "unknown"  # couldn't tell (network error, odd reply); not cached for long
+
+
+# Replies that mean the token itself was rejected
+AUTH_ERROR_STATUSES = (401, 403)
+AUTH_ERROR_MESSAGES = ("unauthenticated.", "unauthorized")
+
+
+def classify(info) -> str:
+    """
+    Judge a getInfo reply (AccountInfo). Account payloads are valid; only a
+    401/403 or a known auth-error message makes a token invalid. Any other
+    error payload (e.g. a 5xx) is UNKNOWN, so it is re-checked soon.
+    """
+    if info is None:
+        return UNKNOWN
+    if info.authenticated:
+        return VALID
+    if info.status in AUTH_ERROR_STATUSES or (info.message or "").lower() in AUTH_ERROR_MESSAGES:
+        return INVALID
+    return UNKNOWN
+
+
+class TokenHealth:
+    """
+    Cached token validity with background re-validation.
+
+    Results are kept per token (by SHA-256 fingerprint, never the token
+    itself) for `ttl` seconds, `invalid_ttl` for rejected tokens and
+    `unknown_ttl` when the check itself failed. Anything that already
+    fetched account info feeds it through `record()`, so validation costs no
+    extra requests in the common case. `refresh(token)` re-checks in the
+    background only when the cached result is stale, and `watch(token)`
+    keeps one token fresh by re-checking it just before its entry expires.
+    `on_change(token, state)` is called (from a worker thread) whenever a
+    token's state changes.
+    """
+
+    def __init__(self, validate, on_change=None, ttl: float = 600.0,
+                 invalid_ttl: float = 3600.0, unknown_ttl: float = 30.0):
+        self.validate = validate  # token -> AccountInfo (may raise)
+        self.on_change = on_change
+        self.ttls = {VALID: ttl, INVALID: invalid_ttl, UNKNOWN: unknown_ttl}
+        self._lock = threading.Lock()
+        self._results: dict[str, tuple[str, float]] = {}
+        self._inflight: set[str] = set()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="token-health")
+        self._watched: str | None = None
+        self._timer: threading.Timer | None = None
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    # ------------------------------------------------------------------ #
+    #  Cache                                                               #
+    # ------------------------------------------------------------------ #
+
+    def status(self, token: str) -> str | None:
+        """The cached state, or None when there is no fresh result."""
+        with self._lock:
+            entry = self._results.get(self._key(token))
+        if entry is None:
+            return None
+        state, checked = entry
+        return state if time.monotonic() - checked < self.ttls[state] else None
+
+    def record(self, token: str, info=None, error: Exception | None = None) -> str:
+        """Store the outcome of a getInfo call made elsewhere."""
+        state = UNKNOWN if error is not None else classify(info)
+        key = self._key(token)
+        with self._lock:
+            previous = self._results.get(key, (None, 0))[0]
+            self._results[key] = (state, time.monotonic())
+        if state != previous and self.on_change:
+            self.on_change(token, state)
+        if token == self._watched:
+            self._schedule(token, state)
+        return state
+
+    # ------------------------------------------------------------------ #
+    #  Validation                                                          #
+    # ------------------------------------------------------------------ #
+
+    def check(self, token: str) -> str:
+        """Validate now (blocking), bypassing the cache."""
+        try:
+            info = self.validate(token)
+        except Exception as e:
+            return self.record(token, error=e)
+        return self.record(token, info)
+
+    def refresh(self, token: str):
+        """Validate in the background unless a fresh result (or a check) exists."""
+        if token and self.status(token) is None:
+            self._submit(token)
+
+    def _submit(self, token: str):
+        key = self._key(token)
+        with self._lock:
+            if key in self._inflight:
+                return
+            self._inflight.add(key)
+        self._executor.submit(self._check_and_release, token, key)
+
+    def _check_and_release(self, token: str, key: str):
+        try:
+            self.check(token)
+        finally:
+            with self._lock:
+                self._inflight.discard(key)
+
+    def watch(self, token: str | None):
+        """Keep `token` validated ahead of use; replaces any previously watched token."""
+        with self._lock:
+            self._watched = token
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if token:
+            self.refresh(token)
+            state = self.status(token)
+            if state is not None:
+                self._schedule(token, state)
+
+    def _schedule(self, token: str, state: str):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            # Re-check slightly before expiry so go-live never waits on a stale entry
+            self._timer = threading.Timer(self.ttls[state] * 0.9, self._revalidate, args=(token,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _revalidate(self, token: str):
+        if token == self._watched:
+            self._submit(token)
+
+    def shutdown(self):
+        self.watch(None)
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,22 +2,133 @@ import hashlib
 import json
 import os
 import base64
-import socket
 import threading
 import webbrowser
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse, parse_qs
 import requests
+from HttpClient import shared_client
+from Instrumentation import redact
+
+
+class _PendingLogin:
+    __slots__ = ("state", "event", "code")
+
+    def __init__(self, state: str):
+        self.state = state
+        self.event = threading.Event()
+        self.code: str | None = None
+
+
+class _CallbackServer:
+    """
+    One loopback listener shared by every login flow in the process.
+
+    It binds once (port chosen by the OS) and keeps the socket, so there is
+    no probe-close-rebind race and no per-login server start/stop. Callbacks
+    are routed to the flow whose `state` they carry; if Streamlabs doesn't
+    echo `state`, they go to the pending flow only when exactly one is
+    waiting. Requests without any OAuth parameters (favicon, probes) and
+    callbacks carrying an unknown `state` never consume a login.
+    """
+
+    # Query parameters that mark a request as the OAuth redirect
+    CALLBACK_PARAMS = ("state", "code", "success")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: OrderedDict[str, _PendingLogin] = OrderedDict()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, daemon=True, name="oauth-callback").start()
+
+    def register(self) -> _PendingLogin:
+        login = _PendingLogin(os.urandom(16).hex())
+        with self._lock:
+            self._pending[login.state] = login
+        return login
+
+    def unregister(self, login: _PendingLogin):
+        with self._lock:
+            self._pending.pop(login.state, None)
+
+    def _route(self, params: dict) -> _PendingLogin | None:
+        if not any(name in params for name in self.CALLBACK_PARAMS):
+            return None
+        state = params.get("state", [None])[0]
+        with self._lock:
+            if state is not None:
+                return self._pending.pop(state, None)
+            if len(self._pending) == 1:
+                return self._pending.popitem()[1]
+            return None
+
+    def _make_handler(self):
+        server = self
+
+        class _CallbackHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query)
+                login = server._route(params)
+
+                if login is None:
+                    status, body = 404, b"<h2>No matching login in progress.</h2>"
+                elif params.get("success", [""])[0] == "true" and "code" in params:
+                    login.code = params["code"][0]
+                    status, body = 200, b"<h2>Authentication successful! You can close this tab.</h2>"
+                else:
+                    status, body = 400, b"<h2>Authentication failed. Please try again.</h2>"
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+                # wake the waiting flow regardless of outcome
+                if login is not None:
+                    login.event.set()
+
+            def log_message(self, *_):
+                pass  # suppress default access log noise
+
+        return _CallbackHandler
+
+
+_callback_server: _CallbackServer | None = None
+_callback_server_lock = threading.Lock()
+
+
+def callback_server() -> _CallbackServer:
+    """The process-wide OAuth callback listener, started on first use."""
+    global _callback_server
+    with _callback_server_lock:
+        if _callback_server is None:
+            _callback_server = _CallbackServer()
+        return _callback_server
 
 
 class TokenRetriever:
-    STREAMLABS_API_URL = "https://streamlabs.com/api/v5/slobs/auth/data"
+    # Overridable (env or class attribute) so logins can be exercised against a local mock server
+    API_BASE = os.environ.get("STREAMLABS_API_BASE", "https://streamlabs.com/api/v5").rstrip("/")
+    EXCHANGE_HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "StreamlabsDesktop/1.20.4 Chrome/122.0.6261.156 "
+            "Electron/29.3.1 Safari/537.36"
+        ),
+        "Accept": "*/*",
+        "Accept-Language": "en-US",
+        "Sec-Fetch-Site": "cross-site",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Dest": "empty",
+    }
 
     def __init__(self):
         self.code_verifier = self._generate_code_verifier()
         self.code_challenge = self._generate_code_challenge(self.code_verifier)
-        self._auth_code: str | None = None
-        self._server_event = threading.Event()
 
     # ------------------------------------------------------------------ #
     #  PKCE helpers                                                        #
@@ -34,60 +145,6 @@ class TokenRetriever:
         digest = hashlib.sha256(verifier.encode()).digest()
         return base64.urlsafe_b64encode(digest).decode().rstrip("=")
 
-    # ------------------------------------------------------------------ #
-    #  Port helper                                                         #
-    # ------------------------------------------------------------------ #
-
-    @staticmethod
-    def _find_free_port() -> int:
-        """Bind to port 0 and let the OS pick a free ephemeral port."""
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(("127.0.0.1", 0))
-            return s.getsockname()[1]
-
-    # ------------------------------------------------------------------ #
-    #  Local callback server                                               #
-    # ------------------------------------------------------------------ #
-
-    def _make_handler(self):
-        """Return an HTTPServer request handler that captures the auth code."""
-        retriever = self  # close over self
-
-        class _CallbackHandler(BaseHTTPRequestHandler):
-            def do_GET(self):
-                parsed = urlparse(self.path)
-                params = parse_qs(parsed.query)
-
-                if params.get("success", [""])[0] == "true" and "code" in params:
-                    retriever._auth_code = params["code"][0]
-                    body = b"<h2>Authentication successful! You can close this tab.</h2>"
-                    self.send_response(200)
-                    self.send_header("Content-Type", "text/html")
-                    self.send_header("Content-Length", str(len(body)))
-                    self.end_headers()
-                    self.wfile.write(body)
-                else:
-                    body = b"<h2>Authentication failed. Please try again.</h2>"
-                    self.send_response(400)
-                    self.send_header("Content-Type", "text/html")
-                    self.send_header("Content-Length", str(len(body)))
-                    self.end_headers()
-                    self.wfile.write(body)
-
-                # signal the main thread regardless of outcome
-                retriever._server_event.set()
-
-            def log_message(self, *_):
-                pass  # suppress default access log noise
-
-        return _CallbackHandler
-
-    def _start_callback_server(self, port: int) -> HTTPServer:
-        server = HTTPServer(("127.0.0.1", port), self._make_handler())
-        thread = threading.Thread(target=server.serve_forever, daemon=True)
-        thread.start()
-        return server
-
     # ------------------------------------------------------------------ #
     #  Main entry point                                                    #
     # ------------------------------------------------------------------ #
@@ -95,7 +152,8 @@ class TokenRetriever:
     def retrieve_token(self, timeout: int = 300) -> str | None:
         """
         Open the Streamlabs login page in the user's default browser, wait for
-        the OAuth callback on a local server, then exchange the code for a token.
+        the OAuth callback on the shared local listener, then exchange the code
+        for a token. Several retrievers may run concurrently.
 
         Args:
             timeout: seconds to wait for the user to complete login (default 5 min)
@@ -103,32 +161,31 @@ class TokenRetriever:
         Returns:
             The oauth_token string on success, or None on failure.
         """
-        port = self._find_free_port()
+        server = callback_server()
+        login = server.register()
 
         auth_url = (
             f"https://streamlabs.com/slobs/login?"
             f"skip_splash=true&external=electron&tiktok&force_verify"
-            f"&origin=slobs&port={port}"
+            f"&origin=slobs&port={server.port}&state={login.state}"
             f"&code_challenge={self.code_challenge}&code_flow=true"
         )
 
-        server = self._start_callback_server(port)
-
-        print(f"Opening browser for Streamlabs login (callback on port {port})…")
+        print(f"Opening browser for Streamlabs login (callback on port {server.port})…")
         webbrowser.open(auth_url)
 
-        completed = self._server_event.wait(timeout=timeout)
-        threading.Thread(target=server.shutdown, daemon=True).start()
+        completed = login.event.wait(timeout=timeout)
+        server.unregister(login)
 
         if not completed:
             print("Timed out waiting for the user to complete login.")
             return None
 
-        if not self._auth_code:
+        if not login.code:
             print("Callback received but no auth code was present.")
             return None
 
-        return self._exchange_code_for_token(self._auth_code)
+        return self._exchange_code_for_token(login.code)
 
     # ------------------------------------------------------------------ #
     #  Token exchange                                                      #
@@ -136,37 +193,27 @@ class TokenRetriever:
 
     def _exchange_code_for_token(self, code: str) -> str | None:
         """POST the auth code + verifier to Streamlabs and return the oauth_token."""
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "StreamlabsDesktop/1.20.4 Chrome/122.0.6261.156 "
-                "Electron/29.3.1 Safari/537.36"
-            ),
-            "Accept": "*/*",
-            "Accept-Language": "en-US",
-            "Sec-Fetch-Site": "cross-site",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Dest": "empty",
-        }
         params = {
             "code_verifier": self.code_verifier,
             "code": code,
         }
 
         try:
-            response = requests.get(
-                self.STREAMLABS_API_URL,
+            response = shared_client().get(
+                f"{self.API_BASE}/slobs/auth/data",
                 params=params,
-                headers=headers,
+                headers=self.EXCHANGE_HEADERS,
                 timeout=30,
+                # The auth code is single use: never retry or share this call
+                retries=0,
+                coalesce=False,
             )
         except requests.RequestException as e:
             print(f"Network error during token exchange: {e}")
             return None
 
         if response.status_code != 200:
-            print(f"Token exchange failed: HTTP {response.status_code} — {response.text}")
+            print(f"Token exchange failed: HTTP {response.status_code} — {redact(response.text)}")
             return None
 
         try:
@@ -176,9 +223,9 @@ class TokenRetriever:
             return None
 
         if not data.get("success"):
-            print(f"Streamlabs reported failure: {data}")
+            print(f"Streamlabs reported failure: {redact(data)}")
             return None
 
         token = data["data"].get("oauth_token")
-        print(f"Got Streamlabs OAuth token: {token}")
+        print("Got Streamlabs OAuth token.")
         return token
\ No newline at end of file
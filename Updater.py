@@ -1,27 +1,89 @@
+import json
+import os
+import time
 from _version import __version__
 from packaging import version
-import requests
+from FileUtils import atomic_write
+from HttpClient import shared_client
+from RequestScheduler import BACKGROUND
 
 
 class VersionChecker:
+    """
+    Latest-release lookup with an on-disk cache (update_check.json).
+
+    Within `MIN_INTERVAL` seconds of the last check the cached release is
+    used without touching the network. After that the request carries the
+    cached ETag as If-None-Match, so an unchanged release costs a 304 with
+    no body (which GitHub doesn't count against the rate limit). Only the
+    tag and URL are cached, never the release notes. The check blocks, so
+    the GUI runs it on a worker (StartupOrchestrator).
+    """
+
     REPO = "Loukious/StreamlabsTikTokStreamKeyGenerator"
-    
+    API_BASE = os.environ.get("GITHUB_API_BASE", "https://api.github.com").rstrip("/")
+    CACHE_PATH = "update_check.json"
+    MIN_INTERVAL = 6 * 3600
+
     @classmethod
-    def check_update(cls):
+    def check_update(cls, min_interval: float | None = None, force: bool = False):
+        """Update info dict if a newer release exists, else None. `force` skips the interval."""
+        if min_interval is None:
+            min_interval = cls.MIN_INTERVAL
+        cache = cls._load_cache()
+        release = cache.get("release")
+        if force or not release or time.time() - cache.get("checked", 0) >= min_interval:
+            release = cls._fetch(cache) or release
+        if not release:
+            return None
         try:
-            response = requests.get(
-                f"https://api.github.com/repos/{cls.REPO}/releases/latest",
-                timeout=5
-            )
-            release = response.json()
             latest = release["tag_name"].lstrip('v')
-            
             if version.parse(latest) > version.parse(__version__):
                 return {
                     "current": __version__,
                     "latest": latest,
                     "url": release["html_url"],
-                    "notes": release.get("body", "")
                 }
         except Exception:
-            return None
\ No newline at end of file
+            pass
+        return None
+
+    @classmethod
+    def _fetch(cls, cache: dict) -> dict | None:
+        """Conditional GET; returns the current release and rewrites the cache, or None on failure."""
+        headers = {"Accept": "application/vnd.github+json"}
+        if cache.get("etag") and cache.get("release"):
+            headers["If-None-Match"] = cache["etag"]
+        try:
+            response = shared_client().get(
+                f"{cls.API_BASE}/repos/{cls.REPO}/releases/latest",
+                headers=headers, timeout=5, priority=BACKGROUND
+            )
+            if response.status_code == 304:
+                release, etag = cache["release"], cache["etag"]
+            elif response.status_code == 200:
+                data = response.json()
+                release = {"tag_name": data["tag_name"], "html_url": data["html_url"]}
+                etag = response.headers.get("ETag")
+            else:
+                return None
+        except Exception:
+            return None
+        cls._save_cache({"v": 1, "checked": time.time(), "etag": etag, "release": release})
+        return release
+
+    @classmethod
+    def _load_cache(cls) -> dict:
+        try:
+            with open(cls.CACHE_PATH, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _save_cache(cls, cache: dict):
+        try:
+            atomic_write(cls.CACHE_PATH, json.dumps(cache).encode("utf-8"))
+        except OSError as e:
+            print(f"Could not save {cls.CACHE_PATH}: {e}")
@@ -0,0 +1,265 @@
+"""
+End-to-end benchmarks against the local mock API (benchmarks/mock_streamlabs.py).
+
+    python benchmarks/e2e.py [--latency 50] [--only search,start_end,accounts,throttle,update,startup,token_scan]
+
+    search      API calls and time-to-suggestions for search-as-you-type
+    start_end   go-live / end-live round-trip latency
+    accounts    SessionManager.refresh_all over many accounts, thread pool vs asyncio
+    throttle    go-live latency during a search burst against a 5 req/s per-token limit
+    update      update check: cold, conditional (304) and within the check interval
+    startup     GUI first paint with a saved token (needs PySide6)
+    token_scan  local apiToken scan throughput over a synthetic leveldb log
+
+Nothing here touches streamlabs.com or api.github.com.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from mock_streamlabs import MockStreamlabs  # noqa: E402
+
+
+def _summary(values_ms: list[float]) -> str:
+    values = sorted(values_ms)
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    return f"median {statistics.median(values):7.1f} ms  p95 {p95:7.1f} ms  max {values[-1]:7.1f} ms"
+
+
+def bench_search(server: MockStreamlabs, keystroke_interval: float = 0.08):
+    """Type a few queries character by character through the real SearchPipeline."""
+    from SearchPipeline import SearchPipeline
+    from Stream import Stream
+
+    Stream.category_cache.clear()
+    stream = Stream("mock-token")
+    results = []
+    done = threading.Event()
+
+    def on_result(categories):
+        results.append(time.perf_counter())
+        done.set()
+
+    pipeline = SearchPipeline(stream.search, on_result)
+    queries = ("Minecraft", "Mine", "Fortnite", "Valorant 1")
+    keystrokes = 0
+    latencies = []
+    server.reset()
+    for query in queries:
+        done.clear()
+        for i in range(1, len(query) + 1):
+            pipeline.submit(query[:i])
+            keystrokes += 1
+            time.sleep(keystroke_interval)
+        typed = time.perf_counter()
+        done.wait(5)
+        if results:
+            latencies.append(max(0.0, results[-1] - typed) * 1000)
+    pipeline.shutdown()
+    calls = server.counts["search"]
+    print(f"  search: {keystrokes} keystrokes -> {calls} API calls "
+          f"({keystrokes / max(calls, 1):.1f}x fewer), cache {Stream.category_cache.stats()}")
+    if latencies:
+        print(f"  suggestions after last keystroke: {_summary(latencies)}")
+
+
+def bench_start_end(server: MockStreamlabs, runs: int = 30):
+    from Stream import Stream
+
+    starts, ends = [], []
+    for i in range(runs):
+        # A fresh token each run keeps the client's per-token rate limit out of the numbers
+        stream = Stream(f"mock-token-{i}")
+        t = time.perf_counter()
+        started = stream.start("Benchmark", "1000")
+        starts.append((time.perf_counter() - t) * 1000)
+        if started is None:
+            continue
+        t = time.perf_counter()
+        stream.end()
+        ends.append((time.perf_counter() - t) * 1000)
+    print(f"  start: {_summary(starts)}")
+    if ends:
+        print(f"    end: {_summary(ends)}")
+
+
+def bench_accounts(server: MockStreamlabs, accounts: int = 200, concurrency: int = 64):
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        print("  skipped (aiohttp not installed)")
+        return
+    import tracemalloc
+    from SessionManager import SessionManager
+
+    manager = SessionManager([{"name": f"acct{i}", "token": f"mock-token-{i}"} for i in range(accounts)],
+                             max_concurrency=concurrency)
+    def client_threads():
+        # The mock serves each connection on its own thread; only count ours
+        return sum(1 for t in threading.enumerate() if "process_request" not in t.name)
+
+    for use_async in (False, True, False, True):
+        manager.use_async = use_async
+        peak_threads = client_threads()
+
+        def on_result(name, result):
+            nonlocal peak_threads
+            peak_threads = max(peak_threads, client_threads())
+
+        tracemalloc.start()
+        t = time.perf_counter()
+        results = manager.refresh_all(on_result=on_result)
+        elapsed = time.perf_counter() - t
+        _, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        errors = sum(1 for r in results.values() if r["error"])
+        label = "asyncio" if use_async else "threads"
+        print(f"  {label}: {accounts} accounts in {elapsed * 1000:7.1f} ms "
+              f"({accounts / elapsed:,.0f}/s), peak threads {peak_threads}, "
+              f"peak traced {peak_mem / 1024:,.0f} KiB, errors {errors}")
+
+
+def bench_throttle(server: MockStreamlabs, searches: int = 30, rate_limit: int = 5):
+    from Stream import Stream
+
+    Stream.category_cache.clear()
+    stream = Stream("mock-throttled-token")
+    errors = []
+
+    def search(i):
+        try:
+            stream.search(f"Minecraft {i}")
+        except Exception as e:
+            errors.append(e)
+
+    server.reset()
+    server.rate_limit = rate_limit
+    try:
+        t = time.perf_counter()
+        threads = [threading.Thread(target=search, args=(i,)) for i in range(searches)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        start = time.perf_counter()
+        started = stream.start("Benchmark", "1000")
+        start_ms = (time.perf_counter() - start) * 1000
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - t
+        if started is not None:
+            stream.end()
+    finally:
+        server.rate_limit = 0
+    print(f"  {searches} searches in {elapsed:.1f} s, {len(errors)} failed, "
+          f"{server.counts['throttled']} answered 429")
+    print(f"  go-live during the burst: {start_ms:.0f} ms ({'ok' if started else 'failed'})")
+
+
+def bench_update(server: MockStreamlabs):
+    from Instrumentation import recorder
+    from Updater import VersionChecker
+
+    with tempfile.TemporaryDirectory() as directory:
+        VersionChecker.CACHE_PATH = os.path.join(directory, "update_check.json")
+        for label, kwargs in (("cold", {"force": True}), ("conditional", {"force": True}), ("cached", {})):
+            server.reset()
+            recorder().clear()
+            t = time.perf_counter()
+            info = VersionChecker.check_update(**kwargs)
+            elapsed = (time.perf_counter() - t) * 1000
+            received = sum(e["bytes_in"] for e in recorder().events())
+            statuses = [e["status"] for e in recorder().events()]
+            print(f"  {label:>11}: {elapsed:6.1f} ms, HTTP {statuses or 'none'}, {received:,} bytes, "
+                  f"update {'found' if info else 'none'}")
+
+
+def bench_startup(server: MockStreamlabs, runs: int = 3):
+    try:
+        import PySide6  # noqa: F401
+    except ImportError:
+        print("  skipped (PySide6 not installed)")
+        return
+    from startup_time import run_once
+
+    env = {"STREAMLABS_API_BASE": server.api_base, "GITHUB_API_BASE": server.base_url}
+    config = {"token": "mock-token", "game": "Minecraft 1", "title": "Benchmark"}
+    samples = [run_once(env, config)["first_paint"] for _ in range(runs)]
+    print(f"  first paint with saved token: {_summary(samples)}")
+
+
+def bench_token_scan(size_mb: int = 64):
+    from LocalTokenFinder import scan_file
+
+    token = "ab" * 32
+    record = f'\x00_https://streamlabs.com\x00\x01apiToken\x01"apiToken":"{token}"'.encode("latin-1")
+    filler = os.urandom(1 << 20).replace(b'"', b" ")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "000003.log")
+        # Worst case for the backwards scan: the only token sits at the very start
+        with open(path, "wb") as f:
+            f.write(record)
+            for _ in range(size_mb):
+                f.write(filler)
+        samples = []
+        for _ in range(3):
+            t = time.perf_counter()
+            found = scan_file(path)
+            samples.append(time.perf_counter() - t)
+        assert found == token, found
+    best = min(samples)
+    print(f"  scan {size_mb} MiB (token at start): {best * 1000:.1f} ms, {size_mb / best:,.0f} MiB/s")
+
+
+BENCHMARKS = {
+    "search": bench_search,
+    "start_end": bench_start_end,
+    "accounts": bench_accounts,
+    "throttle": bench_throttle,
+    "update": bench_update,
+    "startup": bench_startup,
+    "token_scan": bench_token_scan,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=50.0, help="Mock API latency (ms)")
+    parser.add_argument("--jitter", type=float, default=10.0, help="Extra random mock latency up to (ms)")
+    parser.add_argument("--only", help=f"Comma-separated subset of: {','.join(BENCHMARKS)}")
+    args = parser.parse_args()
+
+    selected = args.only.split(",") if args.only else list(BENCHMARKS)
+    server = MockStreamlabs(latency=args.latency / 1000, jitter=args.jitter / 1000).start()
+
+    # In-process code under test talks to the mock, not streamlabs.com
+    os.environ["STREAMLABS_API_BASE"] = server.api_base
+    os.environ["GITHUB_API_BASE"] = server.base_url
+    from Stream import Stream
+    Stream.API_BASE = server.api_base
+
+    try:
+        for name in selected:
+            print(f"{name}:")
+            if name == "token_scan":
+                BENCHMARKS[name]()
+            else:
+                BENCHMARKS[name](server)
+    finally:
+        if "AsyncStream" in sys.modules:
+            sys.modules["AsyncStream"].stop_loop_thread()
+        server.stop()
+        print("mock request counts:", json.dumps(dict(server.counts)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compare cold import time of the headless CLI against the PySide6 GUI module.
+
+    python benchmarks/import_time.py [--runs 10]
+
+Each sample is a fresh interpreter, so nothing is cached in sys.modules.
+The GUI module loads `requests` lazily (on first network call), so "gui" is
+what runs before the first paint and "gui+net" adds the network stack; the
+like-for-like comparison with the CLI is against "gui+net". The breakdown
+is the median cumulative `-X importtime` figure of the heaviest packages.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    "cli": "import StreamKeyCLI, Stream",
+    "gui": "import StreamLabsTikTokStreamKeyGenerator",
+    "gui+net": "import StreamLabsTikTokStreamKeyGenerator, Stream",
+}
+# Packages whose cumulative import cost is broken out per target
+BREAKDOWN = ("requests", "PySide6.QtWidgets")
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    code = (
+        "import time; _t = time.perf_counter(); "
+        f"{statement}; "
+        "print((time.perf_counter() - _t) * 1000)"
+    )
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return samples
+
+
+def breakdown(statement: str, runs: int) -> dict[str, float]:
+    """Median cumulative import time (ms) of each BREAKDOWN package the statement loads."""
+    samples = {name: [] for name in BREAKDOWN}
+    for _ in range(runs):
+        err = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stderr
+        for line in err.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() in samples:
+                samples[parts[2].strip()].append(int(parts[1]) / 1000)
+    return {name: statistics.median(v) for name, v in samples.items() if v}
+
+
+def check_no_qt() -> bool:
+    code = "import sys, StreamKeyCLI, Stream; print(any(m.startswith('PySide6') for m in sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT,
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return out.strip() == "False"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in TARGETS.items():
+        try:
+            results[name] = measure(statement, args.runs)
+        except subprocess.CalledProcessError as e:
+            print(f"{name}: import failed\n{e.stderr}", file=sys.stderr)
+
+    for name, samples in results.items():
+        parts = ", ".join(f"{pkg} {ms:.1f} ms"
+                          for pkg, ms in breakdown(TARGETS[name], args.runs).items())
+        print(f"{name:>7}: median {statistics.median(samples):7.1f} ms  "
+              f"min {min(samples):7.1f} ms  ({len(samples)} runs; {parts or 'n/a'})")
+    for other in ("gui", "gui+net"):
+        if "cli" in results and other in results:
+            ratio = statistics.median(results["cli"]) / statistics.median(results[other])
+            print(f"cli/{other}: {ratio:.0%}")
+    if "cli" in results:
+        print(f"CLI imports Qt: {'no' if check_no_qt() else 'YES'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Local stand-in for the Streamlabs and GitHub endpoints the app talks to.
+
+    python benchmarks/mock_streamlabs.py --port 8765 --latency 80 --error-rate 0.05
+    STREAMLABS_API_BASE=http://127.0.0.1:8765/api/v5 \\
+    GITHUB_API_BASE=http://127.0.0.1:8765 python StreamLabsTikTokStreamKeyGenerator.py
+
+Emulated endpoints:
+    GET  /api/v5/slobs/tiktok/info[?category=...]
+    POST /api/v5/slobs/tiktok/stream/start
+    POST /api/v5/slobs/tiktok/stream/{id}/end
+    GET  /api/v5/slobs/auth/data
+    GET  /repos/{owner}/{repo}/releases/latest   (ETag / If-None-Match -> 304)
+    GET  /__stats              request counts per endpoint
+    POST /__reset              zero the counters
+
+Latency (with jitter), the share of requests answered with HTTP 500, a
+per-token rate limit (429 + Retry-After past N requests a second) and the
+size of the category catalogue are configurable; `MockStreamlabs` can also
+be started in-process by the benchmark suite.
+"""
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+_END_PATH = re.compile(r"^/api/v5/slobs/tiktok/stream/([^/]+)/end$")
+_RELEASE_PATH = re.compile(r"^/repos/[^/]+/[^/]+/releases/latest$")
+_WORDS = ("Minecraft", "Fortnite", "Valorant", "League", "Legends", "Mobile", "Roblox", "Apex",
+          "Call", "Duty", "Grand", "Theft", "Auto", "Counter", "Strike", "Dota", "Rocket",
+          "Among", "Genshin", "Impact", "Elden", "Ring", "Stardew", "Valley", "Chess")
+
+
+def make_categories(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        names.add(" ".join(rng.sample(_WORDS, rng.randint(1, 3))) + f" {rng.randint(1, 99)}")
+    return [{"full_name": name, "game_mask_id": str(1000 + i)} for i, name in enumerate(sorted(names))]
+
+
+class _Server(ThreadingHTTPServer):
+    # The default listen backlog (5) drops connections under concurrent-client benchmarks
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class MockStreamlabs:
+    """Threaded mock API server; `base_url` / `api_base` are valid after start()."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, categories: int = 2000,
+                 page_size: int = 10, version: str = "99.0.0", seed: int = 0,
+                 rate_limit: int = 0):
+        self.latency = latency
+        self.rate_limit = rate_limit  # Streamlabs requests per second per token; 0 = unlimited
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.version = version
+        self.categories = make_categories(categories, seed)
+        self.counts = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(100000)
+        self.live: set[str] = set()
+        self._windows: dict[str, tuple[int, int]] = {}
+        self.httpd = _Server((host, port), self._make_handler())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base(self) -> str:
+        return f"{self.base_url}/api/v5"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True, name="mock-streamlabs")
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.counts.clear()
+
+    # ------------------------------------------------------------------ #
+    #  Endpoint logic                                                      #
+    # ------------------------------------------------------------------ #
+
+    def _delay(self):
+        with self._lock:
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            fail = self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def _throttled(self, token) -> bool:
+        """Fixed one-second window per token, like a simple server-side limiter."""
+        second = int(time.time())
+        with self._lock:
+            window, used = self._windows.get(token, (second, 0))
+            if window != second:
+                window, used = second, 0
+            self._windows[token] = (window, used + 1)
+            return used >= self.rate_limit
+
+    def handle(self, method: str, path: str, query: dict, headers=None) -> tuple:
+        """(status, payload) or (status, payload, extra headers); payload None means no body."""
+        headers = headers or {}
+        token = headers.get("Authorization")
+        if path == "/__stats":
+            with self._lock:
+                return 200, dict(self.counts)
+        if path == "/__reset" and method == "POST":
+            self.reset()
+            return 200, {"success": True}
+
+        end = _END_PATH.match(path)
+        if method == "GET" and path == "/api/v5/slobs/tiktok/info":
+            endpoint = "search" if "category" in query else "info"
+        elif method == "POST" and path == "/api/v5/slobs/tiktok/stream/start":
+            endpoint = "start"
+        elif method == "POST" and end:
+            endpoint = "end"
+        elif method == "GET" and path == "/api/v5/slobs/auth/data":
+            endpoint = "auth"
+        elif method == "GET" and _RELEASE_PATH.match(path):
+            endpoint = "release"
+        else:
+            return 404, {"message": "Not found"}
+
+        with self._lock:
+            self.counts[endpoint] += 1
+        if self.rate_limit and endpoint in ("search", "info", "start", "end") and self._throttled(token):
+            with self._lock:
+                self.counts["throttled"] += 1
+            return 429, {"message": "Too Many Requests"}, {"Retry-After": "1"}
+        if self._delay():
+            return 500, {"message": "Server Error"}
+
+        if endpoint == "search":
+            needle = query["category"][0].casefold()
+            matches = [c for c in self.categories if needle in c["full_name"].casefold()]
+            return 200, {"categories": matches[:self.page_size]}
+        if endpoint == "info":
+            return 200, {
+                "user": {"username": "mock_user"},
+                "application_status": {"status": "approved"},
+                "can_be_live": True,
+            }
+        if endpoint == "start":
+            stream_id = str(next(self._ids))
+            with self._lock:
+                self.live.add(stream_id)
+            return 200, {
+                "id": stream_id,
+                "rtmp": "rtmp://127.0.0.1/live",
+                "key": f"mock-key-{stream_id}",
+            }
+        if endpoint == "end":
+            with self._lock:
+                ended = end.group(1) in self.live
+                self.live.discard(end.group(1))
+            return 200, {"success": ended}
+        if endpoint == "auth":
+            return 200, {"success": True, "data": {"oauth_token": "mock-oauth-token"}}
+        etag = f'"{self.version}"'
+        if headers.get("If-None-Match") == etag:
+            with self._lock:
+                self.counts["release_304"] += 1
+            return 304, None, {"ETag": etag}
+        return 200, {
+            "tag_name": f"v{self.version}",
+            "html_url": f"{self.base_url}/releases/v{self.version}",
+            "body": "Mock release notes " * 500,  # real notes run to several KB
+        }, {"ETag": etag}
+
+    def _make_handler(self):
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+            disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+            def _respond(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                parsed = urlparse(self.path)
+                status, payload, *extra = server.handle(method, parsed.path, parse_qs(parsed.query),
+                                                        self.headers)
+                body = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                for name, value in (extra[0] if extra else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client went away (e.g. the startup probe exited at first paint)
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def log_message(self, *_):
+                pass
+
+        return _Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Streamlabs / GitHub API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency up to this many ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with HTTP 500")
+    parser.add_argument("--categories", type=int, default=2000, help="Size of the category catalogue")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Requests per second per token before 429s")
+    args = parser.parse_args()
+
+    server = MockStreamlabs(args.host, args.port, args.latency / 1000, args.jitter / 1000,
+                            args.error_rate, args.categories, rate_limit=args.rate_limit)
+    print(f"Mock API on {server.base_url}  (STREAMLABS_API_BASE={server.api_base} GITHUB_API_BASE={server.base_url})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
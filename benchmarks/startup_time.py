@@ -0,0 +1,85 @@
+"""
+Measure GUI cold start: module import, window construction and first paint.
+
+    python benchmarks/startup_time.py [--runs 5]
+
+Runs headless on Qt's offscreen platform, each sample in a fresh interpreter
+started in an empty working directory (no config.json, so no account calls).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import StreamLabsTikTokStreamKeyGenerator as gui
+from PySide6.QtCore import QEvent, QObject
+t_import = time.perf_counter()
+
+app = gui.QApplication([])
+window = gui.StreamApp(t0)
+t_constructed = time.perf_counter()
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            t_paint = time.perf_counter()
+            print(json.dumps({
+                "import": (t_import - t0) * 1000,
+                "construct": (t_constructed - t_import) * 1000,
+                "first_paint": (t_paint - t0) * 1000,
+            }), flush=True)
+            # Background startup tasks may still be in flight; don't wait for them
+            os._exit(0)
+        return False
+
+
+probe = FirstPaint()
+window.installEventFilter(probe)
+window.show()
+app.exec()
+"""
+
+
+def run_once(extra_env: dict | None = None, config: dict | None = None) -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", **(extra_env or {}))
+    with tempfile.TemporaryDirectory() as cwd:
+        if config is not None:
+            with open(os.path.join(cwd, "config.json"), "w") as file:
+                json.dump(config, file)
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE, REPO_ROOT], cwd=cwd, env=env,
+            capture_output=True, text=True, timeout=60,
+        )
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print raw samples as JSON")
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+    if args.json:
+        print(json.dumps(samples))
+        return
+    for phase in ("import", "construct", "first_paint"):
+        values = [s[phase] for s in samples]
+        print(f"{phase:>11}: median {statistics.median(values):7.1f} ms  "
+              f"min {min(values):7.1f} ms  max {max(values):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
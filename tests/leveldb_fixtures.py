@@ -0,0 +1,181 @@
+"""
+Writers for synthetic LevelDB files, used to exercise the reader in LevelDB.py.
+
+They follow the on-disk formats (log blocks, WriteBatch, table blocks, footer)
+closely enough for the reader, but skip checksums, since the reader doesn't
+verify them either.
+"""
+import struct
+
+from LevelDB import (
+    BLOCK_TRAILER_SIZE, COMPRESSION_NONE, COMPRESSION_SNAPPY, LOG_BLOCK_SIZE, LOG_FIRST,
+    LOG_FULL, LOG_HEADER_SIZE, LOG_LAST, LOG_MIDDLE, TABLE_FOOTER_SIZE, TABLE_MAGIC,
+    TYPE_DELETION, TYPE_VALUE,
+)
+
+
+def varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def internal_key(user_key: bytes, seq: int, vtype: int = TYPE_VALUE) -> bytes:
+    return user_key + ((seq << 8) | vtype).to_bytes(8, "little")
+
+
+# ---------------------------------------------------------------------- #
+#  Snappy                                                                  #
+# ---------------------------------------------------------------------- #
+
+def snappy_literal(data: bytes) -> bytes:
+    """One literal element (uses the 1-4 byte length forms for long literals)."""
+    n = len(data) - 1
+    if n < 60:
+        return bytes([n << 2]) + data
+    size = (n.bit_length() + 7) // 8
+    return bytes([(59 + size) << 2]) + n.to_bytes(size, "little") + data
+
+
+def snappy_copy(offset: int, length: int, kind: int = 2) -> bytes:
+    """One copy element with a 1 (kind 1), 2 (kind 2) or 4 (kind 3) byte offset."""
+    if kind == 1:
+        assert 4 <= length <= 11 and offset < 2048
+        return bytes([1 | ((length - 4) << 2) | ((offset >> 8) << 5), offset & 0xff])
+    assert 1 <= length <= 64
+    if kind == 2:
+        return bytes([2 | ((length - 1) << 2)]) + offset.to_bytes(2, "little")
+    return bytes([3 | ((length - 1) << 2)]) + offset.to_bytes(4, "little")
+
+
+def snappy_compress(data: bytes) -> bytes:
+    """Naive greedy compressor; matches may overlap the bytes being produced."""
+    out = bytearray(varint(len(data)))
+    literal_start = pos = 0
+    while pos < len(data):
+        best_len = best_off = 0
+        for start in range(max(0, pos - 2048), pos):
+            length = 0
+            while (pos + length < len(data) and length < 64
+                   and data[start + length] == data[pos + length]):
+                length += 1
+            if length > best_len:
+                best_len, best_off = length, pos - start
+        if best_len >= 4:
+            if literal_start < pos:
+                out += snappy_literal(data[literal_start:pos])
+            out += snappy_copy(best_off, best_len)
+            pos += best_len
+            literal_start = pos
+        else:
+            pos += 1
+    if literal_start < len(data):
+        out += snappy_literal(data[literal_start:])
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------- #
+#  Write-ahead log                                                         #
+# ---------------------------------------------------------------------- #
+
+def write_batch(seq: int, ops) -> bytes:
+    """ops: (user_key, value) pairs; value None is a deletion."""
+    out = bytearray(struct.pack("<QI", seq, len(ops)))
+    for key, value in ops:
+        if value is None:
+            out += bytes([TYPE_DELETION]) + varint(len(key)) + key
+        else:
+            out += bytes([TYPE_VALUE]) + varint(len(key)) + key + varint(len(value)) + value
+    return bytes(out)
+
+
+def log_file(records, pad_blocks: bool = True) -> bytes:
+    """
+    Frame logical records the way LevelDB's log writer does: records that
+    don't fit in the current 32 KiB block are split into FIRST/MIDDLE/LAST
+    fragments, and a block tail shorter than a header is zero-filled.
+    """
+    out = bytearray()
+    for record in records:
+        left = record
+        first = True
+        while True:
+            block_left = LOG_BLOCK_SIZE - len(out) % LOG_BLOCK_SIZE
+            if block_left < LOG_HEADER_SIZE:
+                out += b"\0" * block_left
+                block_left = LOG_BLOCK_SIZE
+            avail = block_left - LOG_HEADER_SIZE
+            fragment, left = left[:avail], left[avail:]
+            last = not left
+            rtype = (LOG_FULL if first and last else LOG_FIRST if first
+                     else LOG_LAST if last else LOG_MIDDLE)
+            out += b"\0\0\0\0" + struct.pack("<H", len(fragment)) + bytes([rtype]) + fragment
+            first = False
+            if last:
+                break
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------- #
+#  Tables                                                                  #
+# ---------------------------------------------------------------------- #
+
+def table_block(entries, restart_interval: int = 16) -> bytes:
+    """Prefix-compressed block of (key, value) entries, keys already sorted."""
+    out = bytearray()
+    restarts = []
+    previous = b""
+    for i, (key, value) in enumerate(entries):
+        if i % restart_interval == 0:
+            restarts.append(len(out))
+            shared = 0
+        else:
+            shared = 0
+            while shared < min(len(key), len(previous)) and key[shared] == previous[shared]:
+                shared += 1
+        out += varint(shared) + varint(len(key) - shared) + varint(len(value))
+        out += key[shared:] + value
+        previous = key
+    restarts = restarts or [0]
+    for restart in restarts:
+        out += struct.pack("<I", restart)
+    out += struct.pack("<I", len(restarts))
+    return bytes(out)
+
+
+def table_file(blocks, separators=None, compress: bool = False, restart_interval: int = 16) -> bytes:
+    """
+    A table whose data blocks hold `blocks` (lists of (internal_key, value)).
+    Index separators default to each block's last key; pass `separators`
+    (internal keys) to use shortened ones like LevelDB does.
+    """
+    out = bytearray()
+    handles = []
+
+    def emit(block: bytes):
+        offset = len(out)
+        if compress:
+            data, kind = snappy_compress(block), COMPRESSION_SNAPPY
+        else:
+            data, kind = block, COMPRESSION_NONE
+        out.extend(data + bytes([kind]) + b"\0" * (BLOCK_TRAILER_SIZE - 1))
+        return offset, len(data)
+
+    for block in blocks:
+        handles.append(emit(table_block(block, restart_interval)))
+    separators = separators or [block[-1][0] for block in blocks]
+    metaindex = emit(table_block([]))
+    index = emit(table_block(
+        [(sep, varint(off) + varint(size)) for sep, (off, size) in zip(separators, handles)],
+        restart_interval=1,
+    ))
+    footer = varint(metaindex[0]) + varint(metaindex[1]) + varint(index[0]) + varint(index[1])
+    footer += b"\0" * (TABLE_FOOTER_SIZE - 8 - len(footer))
+    out += footer + TABLE_MAGIC.to_bytes(8, "little")
+    return bytes(out)
@@ -0,0 +1,201 @@
+import pytest
+
+from LevelDB import (
+    LOG_BLOCK_SIZE, LOG_FIRST, LOG_LAST, LOG_MIDDLE, TYPE_DELETION, TYPE_VALUE,
+    LevelDB, LevelDBError, Table, iter_log_entries, iter_log_records, snappy_decompress,
+)
+from leveldb_fixtures import (
+    internal_key, log_file, snappy_compress, snappy_copy, snappy_literal, table_file,
+    varint, write_batch,
+)
+
+
+# ---------------------------------------------------------------------- #
+#  Snappy                                                                  #
+# ---------------------------------------------------------------------- #
+
+def test_snappy_literal_and_copy_forms():
+    data = (varint(20) + snappy_literal(b"abcdefgh")
+            + snappy_copy(8, 4, kind=1) + snappy_copy(8, 4, kind=2) + snappy_copy(8, 4, kind=3))
+    assert snappy_decompress(data) == b"abcdefgh" + b"abcd" + b"efgh" + b"abcd"
+
+
+def test_snappy_long_literal():
+    payload = bytes(range(256)) * 3
+    assert snappy_decompress(varint(len(payload)) + snappy_literal(payload)) == payload
+
+
+@pytest.mark.parametrize("offset, length, expected", [
+    (1, 10, b"xyz" + b"z" * 10),                # run of the last byte
+    (3, 10, b"xyz" + b"xyzxyzxyzx"),            # pattern repeated past its end
+    (2, 5, b"xyz" + b"yzyzy"),
+])
+def test_snappy_overlapping_copy(offset, length, expected):
+    data = varint(len(expected)) + snappy_literal(b"xyz") + snappy_copy(offset, length)
+    assert snappy_decompress(data) == expected
+
+
+def test_snappy_roundtrip_with_fixture_compressor():
+    payload = b"header" + b"a" * 300 + b"abcabcabc" * 40 + bytes(range(50)) + b"header" * 5
+    compressed = snappy_compress(payload)
+    assert len(compressed) < len(payload)
+    assert snappy_decompress(compressed) == payload
+
+
+def test_snappy_rejects_bad_offset_and_length():
+    with pytest.raises(LevelDBError):
+        snappy_decompress(varint(8) + snappy_literal(b"abc") + snappy_copy(4, 5))
+    with pytest.raises(LevelDBError):
+        snappy_decompress(varint(10) + snappy_literal(b"abc"))
+
+
+# ---------------------------------------------------------------------- #
+#  Write-ahead log                                                         #
+# ---------------------------------------------------------------------- #
+
+def test_log_record_split_across_blocks():
+    small = write_batch(1, [(b"a", b"1")])
+    big = write_batch(2, [(b"big", b"v" * (LOG_BLOCK_SIZE * 2))])
+    data = log_file([small, big, small])
+    # The big record really was fragmented: FIRST, then MIDDLE, then LAST
+    types = {data[pos + 6] for pos in (len(log_file([small])),
+                                       LOG_BLOCK_SIZE, 2 * LOG_BLOCK_SIZE)}
+    assert types == {LOG_FIRST, LOG_MIDDLE, LOG_LAST}
+    records = [payload for _, payload in iter_log_records(data)]
+    assert records == [small, big, small]
+
+
+def test_log_skips_block_trailer():
+    # Fill the first block so fewer than a header's worth of bytes remain
+    first = write_batch(1, [(b"k", b"x" * (LOG_BLOCK_SIZE - 7 - 12 - 4 - 3))])
+    second = write_batch(2, [(b"k", b"y")])
+    data = log_file([first, second])
+    assert LOG_BLOCK_SIZE - len(log_file([first])) < 7
+    assert [payload for _, payload in iter_log_records(data)] == [first, second]
+
+
+def test_log_partial_tail_is_not_yielded_and_resume_offset_holds():
+    one = write_batch(1, [(b"k", b"1")])
+    two = write_batch(2, [(b"k", b"2")])
+    full = log_file([one, two])
+    cut = full[:-3]  # writer is mid-append
+    yielded = list(iter_log_records(cut))
+    assert [payload for _, payload in yielded] == [one]
+    resume = yielded[-1][0]
+    assert [payload for _, payload in iter_log_records(full, resume)] == [two]
+
+
+def test_log_zero_padding_ends_block():
+    record = write_batch(1, [(b"k", b"1")])
+    data = log_file([record]) + b"\0" * 64
+    assert [payload for _, payload in iter_log_records(data)] == [record]
+
+
+def test_log_entries_values_and_deletions():
+    data = log_file([write_batch(10, [(b"a", b"1"), (b"b", None), (b"c", b"3")])])
+    entries = [(key, seq, vtype, value) for _, key, seq, vtype, value in iter_log_entries(data)]
+    assert entries == [(b"a", 10, TYPE_VALUE, b"1"), (b"b", 11, TYPE_DELETION, None),
+                       (b"c", 12, TYPE_VALUE, b"3")]
+
+
+# ---------------------------------------------------------------------- #
+#  Tables                                                                  #
+# ---------------------------------------------------------------------- #
+
+BLOCKS = [
+    [(internal_key(b"apple", 5), b"A"), (internal_key(b"banana", 6), b"B")],
+    [(internal_key(b"cherry", 7), b"C"), (internal_key(b"kiwi", 9), b"K9")],
+    [(internal_key(b"kiwi", 3), b"K3"), (internal_key(b"mango", 8), b"M")],
+]
+# Shortened separators, as LevelDB writes them: >= the block's last key, < the next block's first
+SEPARATORS = [internal_key(b"c", 0), internal_key(b"kiwi", 9), internal_key(b"n", 0)]
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "snappy"])
+def table(tmp_path, request):
+    path = tmp_path / "000005.ldb"
+    path.write_bytes(table_file(BLOCKS, SEPARATORS, compress=request.param, restart_interval=2))
+    return Table(str(path))
+
+
+@pytest.mark.parametrize("key, expected", [
+    (b"apple", [(5, TYPE_VALUE, b"A")]),
+    (b"cherry", [(7, TYPE_VALUE, b"C")]),
+    (b"mango", [(8, TYPE_VALUE, b"M")]),
+    # Versions on both sides of a block boundary
+    (b"kiwi", [(9, TYPE_VALUE, b"K9"), (3, TYPE_VALUE, b"K3")]),
+    # Absent keys: before, between blocks (at and below a separator) and after everything
+    (b"aaa", []),
+    (b"bz", []),
+    (b"c", []),
+    (b"zebra", []),
+])
+def test_table_get(table, key, expected):
+    assert list(table.get(key)) == expected
+
+
+def test_table_get_stops_at_separator(table, monkeypatch):
+    read = []
+    original = Table._read_block
+
+    def spy(self, f, offset, size):
+        read.append(offset)
+        return original(self, f, offset, size)
+
+    with open(table.path, "rb") as f:
+        table._load_index(f)
+    monkeypatch.setattr(Table, "_read_block", spy)
+    assert list(table.get(b"bz")) == []
+    assert len(read) == 1  # only the first block; "c" >= "bz" rules out the rest
+
+
+def test_table_items(table):
+    keys = [(key, seq) for key, seq, _, _ in table.items()]
+    assert keys == [(b"apple", 5), (b"banana", 6), (b"cherry", 7), (b"kiwi", 9),
+                    (b"kiwi", 3), (b"mango", 8)]
+
+
+def test_table_rejects_bad_magic(tmp_path):
+    path = tmp_path / "bad.ldb"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(LevelDBError):
+        list(Table(str(path)).get(b"a"))
+
+
+# ---------------------------------------------------------------------- #
+#  Database                                                                #
+# ---------------------------------------------------------------------- #
+
+def _database(tmp_path):
+    (tmp_path / "000005.ldb").write_bytes(table_file(BLOCKS, SEPARATORS))
+    (tmp_path / "000007.log").write_bytes(log_file([
+        write_batch(20, [(b"apple", b"A2")]),
+        write_batch(21, [(b"cherry", None)]),
+        write_batch(1, [(b"mango", b"stale")]),
+    ]))
+    return LevelDB(str(tmp_path))
+
+
+def test_get_many_newest_sequence_wins(tmp_path):
+    db = _database(tmp_path)
+    assert db.get_many([b"apple", b"cherry", b"mango", b"kiwi", b"missing"]) == {
+        b"apple": b"A2",     # log is newer than the table
+        b"mango": b"M",      # table is newer than the log
+        b"kiwi": b"K9",      # newest of two table versions
+    }                        # cherry was deleted in the log
+    assert db.get(b"cherry") is None
+
+
+def test_items_covers_logs_and_tables(tmp_path):
+    entries = {(key, seq) for key, seq, _, _ in _database(tmp_path).items()}
+    assert (b"apple", 20) in entries and (b"apple", 5) in entries and (b"cherry", 21) in entries
+
+
+def test_unreadable_files_are_reported_and_skipped(tmp_path, capsys):
+    db = _database(tmp_path)
+    (tmp_path / "000009.ldb").write_bytes(b"not a table")
+    (tmp_path / "000008.log").mkdir()  # can't be opened as a file
+    assert db.get_many([b"apple"]) == {b"apple": b"A2"}
+    assert ("apple", 20) in {(key.decode(), seq) for key, seq, _, _ in db.items()}
+    out = capsys.readouterr().out
+    assert "000009.ldb" in out and "000008.log" in out